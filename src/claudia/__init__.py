@@ -8,6 +8,13 @@ atomic task assignment, session tracking, and git-native branch workflows.
 __version__ = "1.1.0"
 __author__ = "Paul Kasay"
 
-from claudia.agent import Agent
-
 __all__ = ["Agent", "__version__"]
+
+
+def __getattr__(name):
+    # Import Agent on first access so `from claudia import __version__`
+    # (used by the CLI on every invocation) doesn't pull in claudia.agent.
+    if name == "Agent":
+        from claudia.agent import Agent
+        return Agent
+    raise AttributeError(f"module 'claudia' has no attribute {name!r}")
@@ -151,6 +151,51 @@ def is_task_ready(task: dict, task_map: dict) -> bool:
     return True
 
 
+def replay_journal(data: dict, journal_file: Path, loads=json.loads) -> int:
+    """
+    Apply coordinator journal entries newer than the snapshot to data.
+
+    In parallel mode the coordinator appends task changes to tasks.jsonl and
+    only folds them into tasks.json periodically, so tasks.json alone can be
+    behind (or missing) after a crash. Only lines tagged with the snapshot's
+    journal_gen apply; a torn final line ends the replay.
+
+    Args:
+        data: Snapshot dict as loaded from tasks.json (updated in place)
+        journal_file: Path to tasks.jsonl
+        loads: JSON decoder for journal lines
+
+    Returns:
+        Number of journal entries applied
+    """
+    try:
+        f = open(journal_file, 'rb')
+    except FileNotFoundError:
+        return 0
+
+    gen = data.get('journal_gen', 0)
+    tasks = {t['id']: t for t in data.get('tasks', [])}
+    applied = 0
+    with f:
+        for line in f:
+            try:
+                event = loads(line)
+            except ValueError:
+                break  # Torn final line from a crash mid-append
+            if event.get('gen') != gen:
+                continue
+            for t in event['tasks']:
+                tasks[t['id']] = t
+            for tid in event.get('deleted', ()):
+                tasks.pop(tid, None)
+            data['next_id'] = max(data.get('next_id', 1), event['next_id'])
+            applied += 1
+
+    if applied:
+        data['tasks'] = list(tasks.values())
+    return applied
+
+
 @dataclass
 class Agent:
     """
@@ -405,15 +450,29 @@ class Agent:
         self._recover_tmp_file()
 
         tasks_file = self.state_dir / 'tasks.json'
+        journal_file = tasks_file.with_suffix('.jsonl')
         if tasks_file.exists():
             data = json.loads(tasks_file.read_text())
-            # Apply schema migrations if needed
-            migrated = self._migrate_schema(data)
-            if migrated.get('version', 1) != data.get('version', 1):
-                # Save migrated data
-                self._save_tasks(migrated)
-            return migrated
-        return {'version': 2, 'next_id': 1, 'tasks': []}
+        elif journal_file.exists():
+            # Coordinator never snapshotted; everything is in the journal
+            data = {'version': 2, 'next_id': 1, 'tasks': []}
+        else:
+            return {'version': 2, 'next_id': 1, 'tasks': []}
+
+        replayed = replay_journal(data, journal_file)
+        # Apply schema migrations if needed
+        migrated = self._migrate_schema(data)
+        if replayed and not self._parallel_mode:
+            # A coordinator stopped without its final snapshot. Fold its journal
+            # into tasks.json under a new generation, so a later coordinator
+            # can't replay those lines over tasks written in single mode.
+            migrated['journal_gen'] = migrated.get('journal_gen', 0) + 1
+            self._save_tasks(migrated)
+            journal_file.unlink(missing_ok=True)
+        elif migrated.get('version', 1) != data.get('version', 1):
+            # Save migrated data
+            self._save_tasks(migrated)
+        return migrated
 
     def _save_tasks(self, data: dict):
         """Save tasks to JSON file with file locking for concurrent safety."""
@@ -652,20 +711,22 @@ class Agent:
         else:
             data = self._load_tasks()
 
-            # Find ready tasks
-            ready = [t for t in data['tasks'] if self._is_task_ready(t, data['tasks'])]
+            # Find ready tasks (one task map for the whole scan)
+            task_map = {t['id']: t for t in data['tasks']}
+            ready = [t for t in data['tasks'] if is_task_ready(t, task_map)]
 
             if not ready:
                 return None
 
-            # Score and sort
+            # Pick the best-scored task; label set is built once, not per task
+            preferred = frozenset(labels) if labels else frozenset()
+
             def score(task):
                 priority = task.get('priority', 2)
-                label_match = -len(set(task.get('labels', [])) & set(labels)) if labels else 0
+                label_match = -len(preferred.intersection(task.get('labels') or ()))
                 return (priority, label_match, task.get('created_at', ''))
 
-            ready.sort(key=score)
-            task = ready[0]
+            task = min(ready, key=score)
 
             # Ensure session is registered before claiming
             self._ensure_session_registered()
@@ -1796,17 +1857,37 @@ class Agent:
         if not archive_file.exists():
             return []
 
+        with open(archive_file, 'r') as f:
+            lines = f.readlines()
+
+        # Most recent first; only parse as many lines as needed to fill limit
         tasks = []
+        for line in reversed(lines):
+            if len(tasks) >= limit:
+                break
+            try:
+                tasks.append(json.loads(line.strip()))
+            except json.JSONDecodeError:
+                continue
+        return tasks
+
+    def is_archived(self, task_id: str) -> bool:
+        """Check whether a task is in the archive."""
+        archive_file = self.state_dir / 'archive.jsonl'
+        if not archive_file.exists():
+            return False
+
         with open(archive_file, 'r') as f:
             for line in f:
+                # Cheap substring filter before paying for a parse
+                if task_id not in line:
+                    continue
                 try:
-                    tasks.append(json.loads(line.strip()))
+                    if json.loads(line).get('id') == task_id:
+                        return True
                 except json.JSONDecodeError:
                     continue
-
-        # Return most recent first
-        tasks.reverse()
-        return tasks[:limit]
+        return False
 
     def restore_from_archive(self, task_id: str) -> Optional[dict]:
         """Restore a task from the archive."""
@@ -1909,6 +1990,26 @@ class Agent:
                 tasks = [t for t in tasks if t.get('status') == status]
             return tasks
 
+    def get_task(self, task_id: str) -> Optional[dict]:
+        """Get a single task by ID, or None if it doesn't exist."""
+        if self._parallel_mode:
+            tasks = self.get_tasks()
+        else:
+            tasks = self._load_tasks()['tasks']
+        for task in tasks:
+            if task['id'] == task_id:
+                return task
+        return None
+
+    def get_tasks_by_ids(self, task_ids: list) -> dict:
+        """Get the tasks with the given IDs, as a dict keyed by ID. Unknown IDs are omitted."""
+        wanted = set(task_ids)
+        if self._parallel_mode:
+            tasks = self.get_tasks()
+        else:
+            tasks = self._load_tasks()['tasks']
+        return {t['id']: t for t in tasks if t['id'] in wanted}
+
     def _log_event(self, event: str, details: dict = None, undo_data: dict = None):
         """
         Append to history log with optional undo data.
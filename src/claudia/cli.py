@@ -11,65 +11,104 @@ Usage:
     claudia update --check          # Check for updates
 """
 
-import argparse
+import functools
 import json
-import shutil
+import os
+import re
 import sys
-import urllib.request
-import urllib.error
-from datetime import datetime, timezone
+import time
 from pathlib import Path
+from typing import Optional
 
+# Heavier imports (argparse, Agent, datetime, shutil, urllib) are deferred to
+# the code that uses them so --version, --help and init start quickly.
 from claudia import __version__
-from claudia.agent import Agent, is_task_ready
-from claudia.colors import Colors, priority_str as _color_priority, status_str as _color_status
+from claudia.colors import COLORS_ENABLED, Colors, priority_str as _color_priority, status_str as _color_status
+
+# Optional fast JSON backend (pip install 'claudia[fast]'). Only used for
+# CLI output and session files; tasks.json/version.json stay on stdlib json
+# so their on-disk formatting doesn't depend on what's installed.
+try:
+    import orjson
+
+    def _print_json(obj) -> None:
+        """Write obj to stdout as indented JSON plus a newline."""
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            sys.stdout.write(data.decode())
+        else:
+            # Skip the text layer; flush it first so earlier output stays in order
+            sys.stdout.flush()
+            buffer.write(data)
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_iterencode = json.JSONEncoder(indent=2).iterencode
+
+    def _print_json(obj) -> None:
+        """Write obj to stdout as indented JSON plus a newline."""
+        # Stream the shared encoder's chunks rather than building the whole string
+        sys.stdout.writelines(_json_iterencode(obj))
+        sys.stdout.write('\n')
+
+    _json_loads = json.loads
 
 
 # ============================================================================
 # Formatting Helpers
 # ============================================================================
 
+_PRIO_LABELS = ("P0 critical", "P1 high", "P2 medium", "P3 low")
+
+
 def _format_priority(p: int) -> str:
     """Format priority as P0-P3 with label."""
-    labels = {0: "P0 critical", 1: "P1 high", 2: "P2 medium", 3: "P3 low"}
-    return labels.get(p, f"P{p}")
+    # Stored priorities aren't validated, so tolerate None or strings
+    return _PRIO_LABELS[p] if isinstance(p, int) and 0 <= p <= 3 else f"P{p}"
+
 
+# datetime.fromisoformat() accepts a trailing 'Z' from Python 3.11
+_ISO_NATIVE_Z = sys.version_info >= (3, 11)
+
+
+def _format_duration(iso_start: str, now=None) -> str:
+    """Format duration from ISO timestamp to now as human-readable string.
+
+    Pass ``now`` (an aware UTC datetime) when formatting many timestamps.
+    """
+    from datetime import datetime, timezone
 
-def _format_duration(iso_start: str) -> str:
-    """Format duration from ISO timestamp to now as human-readable string."""
     try:
         # Handle various ISO formats
         if not iso_start:
             return "?"
 
-        # Remove trailing Z and handle +00:00 suffix
-        if iso_start.endswith('Z'):
+        # The coordinator appends Z to an already-aware isoformat() ("+00:00Z");
+        # a bare trailing Z is only a problem before 3.11
+        if iso_start.endswith('+00:00Z'):
+            iso_start = iso_start[:-1]
+        elif not _ISO_NATIVE_Z and iso_start.endswith('Z'):
             iso_start = iso_start[:-1] + '+00:00'
-        elif '+00:00Z' in iso_start:
-            iso_start = iso_start.replace('+00:00Z', '+00:00')
 
         start = datetime.fromisoformat(iso_start)
         if start.tzinfo is None:
             start = start.replace(tzinfo=timezone.utc)
 
-        delta = datetime.now(timezone.utc) - start
+        delta = (now or datetime.now(timezone.utc)) - start
         total_seconds = int(delta.total_seconds())
 
         if total_seconds < 0:
             return "?"
-        elif total_seconds < 60:
-            return f"{total_seconds}s"
-        elif total_seconds < 3600:
-            mins = total_seconds // 60
-            return f"{mins}m"
-        elif total_seconds < 86400:
-            hours = total_seconds // 3600
-            mins = (total_seconds % 3600) // 60
-            return f"{hours}h {mins}m" if mins else f"{hours}h"
-        else:
-            days = total_seconds // 86400
-            hours = (total_seconds % 86400) // 3600
+
+        days, rem = divmod(total_seconds, 86400)
+        hours, rem = divmod(rem, 3600)
+        mins, secs = divmod(rem, 60)
+        if days:
             return f"{days}d {hours}h" if hours else f"{days}d"
+        if hours:
+            return f"{hours}h {mins}m" if mins else f"{hours}h"
+        return f"{mins}m" if mins else f"{secs}s"
     except (ValueError, TypeError):
         return "?"
 
@@ -81,39 +120,58 @@ def _format_task_short(task: dict, use_color: bool = True) -> str:
     priority = task.get('priority', 2)
     labels = task.get('labels', [])
 
-    parts = [f'{task_id}: "{title}"']
-    if use_color and Colors.is_enabled():
-        parts.append(f"[{_color_priority(priority)}]")
-    else:
-        parts.append(f"[P{priority}]")
+    # One template per color mode; no intermediate parts list
+    if use_color and COLORS_ENABLED:
+        if labels:
+            return (f'{task_id}: "{title}" [{_color_priority(priority)}] '
+                    f'{Colors.DIM}[{", ".join(labels[:3])}]{Colors.RESET}')
+        return f'{task_id}: "{title}" [{_color_priority(priority)}]'
     if labels:
-        label_str = ', '.join(labels[:3])
-        if use_color and Colors.is_enabled():
-            parts.append(f"{Colors.DIM}[{label_str}]{Colors.RESET}")
-        else:
-            parts.append(f"[{label_str}]")
+        return f'{task_id}: "{title}" [P{priority}] [{", ".join(labels[:3])}]'
+    return f'{task_id}: "{title}" [P{priority}]'
+
+
+def _search_tasks(tasks: list, search_terms: list) -> list:
+    """Filter tasks whose title or description contains any of search_terms (case-insensitive)."""
+    if len(search_terms) == 1:
+        needle = search_terms[0].lower()
+
+        def contains(text):
+            return needle in text
+    else:
+        # One pass over the text for all terms instead of one scan per term
+        contains = re.compile('|'.join(re.escape(term.lower()) for term in search_terms)).search
 
-    return ' '.join(parts)
+    matches = []
+    for t in tasks:
+        # Titles are short and match most often; only lower the description on a miss
+        if contains((t.get('title') or '').lower()) or contains((t.get('description') or '').lower()):
+            matches.append(t)
+    return matches
+
+
+# (status key, Colors attribute, label) in summary order; ready is inserted after open
+_STATUS_ROWS = (
+    ('open', 'CYAN', 'open'),
+    ('in_progress', 'YELLOW', 'in progress'),
+    ('done', 'GREEN', 'done'),
+    ('blocked', 'RED', 'blocked'),
+)
 
 
 def _format_task_status_summary(status_counts: dict, ready_count: int, use_color: bool = True) -> str:
     """Format task status counts as summary string."""
+    if use_color and COLORS_ENABLED:
+        fmt = "{color}{n} {label}" + Colors.RESET
+    else:
+        fmt = "{n} {label}"
     parts = []
-    use_c = use_color and Colors.is_enabled()
-    if status_counts.get('open'):
-        count = status_counts['open']
-        parts.append(f"{Colors.CYAN}{count} open{Colors.RESET}" if use_c else f"{count} open")
-    if ready_count:
-        parts.append(f"{Colors.GREEN}{ready_count} ready{Colors.RESET}" if use_c else f"{ready_count} ready")
-    if status_counts.get('in_progress'):
-        count = status_counts['in_progress']
-        parts.append(f"{Colors.YELLOW}{count} in progress{Colors.RESET}" if use_c else f"{count} in progress")
-    if status_counts.get('done'):
-        count = status_counts['done']
-        parts.append(f"{Colors.GREEN}{count} done{Colors.RESET}" if use_c else f"{count} done")
-    if status_counts.get('blocked'):
-        count = status_counts['blocked']
-        parts.append(f"{Colors.RED}{count} blocked{Colors.RESET}" if use_c else f"{count} blocked")
+    for key, color, label in _STATUS_ROWS:
+        count = status_counts.get(key)
+        if count:
+            parts.append(fmt.format(color=getattr(Colors, color), n=count, label=label))
+        if key == 'open' and ready_count:
+            parts.append(fmt.format(color=Colors.GREEN, n=ready_count, label='ready'))
     return ', '.join(parts) if parts else "no tasks"
 
 
@@ -156,10 +214,23 @@ claudia session             # View active sessions
 ```
 '''
 
+# Encoded once; init writes these with binary opens
+_CLAUDE_MD_BYTES = CLAUDE_MD_CONTENT.encode('utf-8')
+_CLAUDE_MD_NEW_FILE_BYTES = CLAUDE_MD_CONTENT.lstrip().encode('utf-8')
+
+_GITIGNORE_HEADER = '# Claudia agent state\n'
+_GITIGNORE_ENTRIES = (
+    '.agent-state/sessions/*.json',
+    '.agent-state/.parallel-mode',
+    '.agent-state/coordinator.pid',
+    '.agent-state/tasks.jsonl',
+)
+_GITIGNORE_NEW_FILE_BYTES = (_GITIGNORE_HEADER + ''.join(e + '\n' for e in _GITIGNORE_ENTRIES)).encode('utf-8')
+
 
 def cmd_init(args):
     """Initialize Claudia in the current directory."""
-    target = Path(args.path or '.').resolve()
+    target = Path(args.path).resolve() if args.path else Path.cwd()
     state_dir = target / '.agent-state'
 
     if state_dir.exists() and not args.force:
@@ -169,77 +240,69 @@ def cmd_init(args):
 
     print(f"Initializing Claudia in {target}")
 
-    # Create state directory
-    state_dir.mkdir(parents=True, exist_ok=True)
-    (state_dir / 'sessions').mkdir(exist_ok=True)
-
-    # Create tasks.json if doesn't exist
-    tasks_file = state_dir / 'tasks.json'
-    if not tasks_file.exists():
-        tasks_file.write_text(json.dumps({
-            'version': 1,
-            'next_id': 1,
-            'tasks': []
-        }, indent=2))
+    # Create state directory and sessions/ in one call
+    os.makedirs(state_dir / 'sessions', exist_ok=True)
+
+    # Create tasks.json if doesn't exist ('x' mode folds the exists check into open)
+    tasks_payload = json.dumps({
+        'version': 1,
+        'next_id': 1,
+        'tasks': []
+    }, indent=2)
+    try:
+        with open(state_dir / 'tasks.json', 'x') as f:
+            f.write(tasks_payload)
         print("  ✓ Created tasks.json")
-    else:
+    except FileExistsError:
         print("  ⚠ tasks.json exists, skipping")
 
     # Create history.jsonl if doesn't exist
-    history_file = state_dir / 'history.jsonl'
-    if not history_file.exists():
-        history_file.write_text('')
+    try:
+        open(state_dir / 'history.jsonl', 'x').close()
         print("  ✓ Created history.jsonl")
-    else:
+    except FileExistsError:
         print("  ⚠ history.jsonl exists, skipping")
 
     # Create .gitkeep in sessions
-    gitkeep = state_dir / 'sessions' / '.gitkeep'
-    if not gitkeep.exists():
-        gitkeep.write_text('# Keep this directory in git\n')
+    try:
+        with open(state_dir / 'sessions' / '.gitkeep', 'x') as f:
+            f.write('# Keep this directory in git\n')
+    except FileExistsError:
+        pass
 
     # Update .gitignore
     gitignore = target / '.gitignore'
-    gitignore_entries = [
-        '.agent-state/sessions/*.json',
-        '.agent-state/.parallel-mode',
-        '.agent-state/coordinator.pid',
-    ]
-
     if gitignore.exists():
-        content = gitignore.read_text()
-        added = []
-        for entry in gitignore_entries:
-            if entry not in content:
-                added.append(entry)
+        # One handle: read, then append any missing entries at EOF
+        with open(gitignore, 'r+') as f:
+            existing = {line.strip() for line in f.read().splitlines()}
+            added = [entry for entry in _GITIGNORE_ENTRIES if entry not in existing]
+            if added:
+                f.write('\n' + _GITIGNORE_HEADER)
+                f.writelines(entry + '\n' for entry in added)
         if added:
-            with open(gitignore, 'a') as f:
-                f.write('\n# Claudia agent state\n')
-                for entry in added:
-                    f.write(entry + '\n')
             print("  ✓ Updated .gitignore")
     else:
-        with open(gitignore, 'w') as f:
-            f.write('# Claudia agent state\n')
-            for entry in gitignore_entries:
-                f.write(entry + '\n')
+        gitignore.write_bytes(_GITIGNORE_NEW_FILE_BYTES)
         print("  ✓ Created .gitignore")
 
     # Append to CLAUDE.md
     claude_md = target / 'CLAUDE.md'
     if claude_md.exists():
+        # Single substring pass; any mention means the section is already there
         content = claude_md.read_text()
         if 'Claudia' not in content:
-            with open(claude_md, 'a') as f:
-                f.write(CLAUDE_MD_CONTENT)
+            with open(claude_md, 'ab') as f:
+                f.write(_CLAUDE_MD_BYTES)
             print("  ✓ Appended to CLAUDE.md")
         else:
             print("  ⚠ CLAUDE.md already has Claudia section")
     else:
-        claude_md.write_text(CLAUDE_MD_CONTENT.lstrip())
+        claude_md.write_bytes(_CLAUDE_MD_NEW_FILE_BYTES)
         print("  ✓ Created CLAUDE.md")
 
     # Store version
+    from datetime import datetime, timezone
     version_file = state_dir / 'version.json'
     version_file.write_text(json.dumps({
         'version': __version__,
@@ -259,9 +322,19 @@ def cmd_init(args):
 # Uninstall Command
 # ============================================================================
 
+# The section init appends: an optional '---' rule, the Claudia heading, and
+# everything up to the next top-level heading that isn't Claudia's own
+_CLAUDIA_SECTION_RE = re.compile(
+    r'(?:^---\n\s*)?^# Claudia Task Coordination$.*?(?=^# (?![^\n]*Claudia)|\Z)',
+    re.MULTILINE | re.DOTALL,
+)
+
+
 def cmd_uninstall(args):
     """Remove Claudia from the current directory."""
-    target = Path(args.path or '.').resolve()
+    import shutil
+
+    target = Path(args.path).resolve() if args.path else Path.cwd()
     state_dir = target / '.agent-state'
 
     if not state_dir.exists():
@@ -301,23 +374,7 @@ def cmd_uninstall(args):
         content = claude_md.read_text()
         # Remove Claudia section
         if '# Claudia Task Coordination' in content:
-            # Find and remove the section
-            lines = content.split('\n')
-            new_lines = []
-            skip = False
-            for line in lines:
-                if line.strip() == '# Claudia Task Coordination':
-                    skip = True
-                    # Also remove preceding ---
-                    if new_lines and new_lines[-1].strip() == '---':
-                        new_lines.pop()
-                    continue
-                if skip and line.startswith('# ') and 'Claudia' not in line:
-                    skip = False
-                if not skip:
-                    new_lines.append(line)
-
-            new_content = '\n'.join(new_lines).rstrip() + '\n'
+            new_content = _CLAUDIA_SECTION_RE.sub('', content).rstrip() + '\n'
             if new_content.strip():
                 claude_md.write_text(new_content)
                 print("  ✓ Cleaned CLAUDE.md")
@@ -342,9 +399,8 @@ def cmd_uninstall(args):
             new_lines.append(line)
 
         new_content = '\n'.join(new_lines)
-        # Remove multiple blank lines
-        while '\n\n\n' in new_content:
-            new_content = new_content.replace('\n\n\n', '\n\n')
+        # Collapse runs of blank lines in one pass
+        new_content = re.sub(r'\n{3,}', '\n\n', new_content)
         gitignore.write_text(new_content.rstrip() + '\n')
         print("  ✓ Cleaned .gitignore")
 
@@ -358,9 +414,17 @@ def cmd_uninstall(args):
 
 GITHUB_REPO = "pwkasay/claudia"
 
+# How long a cached latest-release response is trusted before re-checking
+UPDATE_CACHE_TTL = 3600  # 1 hour
+
 
+@functools.lru_cache(maxsize=1)
 def _get_ssl_context():
-    """Get SSL context, trying certifi first, then system certs, then unverified."""
+    """Get SSL context, trying certifi first, then system certs, then unverified.
+
+    Cached: loading the CA bundle reads it from disk, and it won't change
+    within a process.
+    """
     import ssl
 
     # Try certifi first (if installed)
@@ -385,57 +449,122 @@ def _get_ssl_context():
     return ctx
 
 
+def _update_cache_file() -> Path:
+    """Location of the cached latest-release response."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'claudia' / 'latest_release.json'
+
+
+def _read_update_cache(cache_file: Path) -> Optional[dict]:
+    """Load the cached release info, or None if missing/corrupt."""
+    try:
+        data = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+    # Valid JSON that isn't an object (say, a hand-edited list) is corrupt too
+    return data if isinstance(data, dict) else None
+
+
+def _write_update_cache(cache_file: Path, release: dict):
+    """Atomically write release info to the cache (best-effort)."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        tmp_file.write_text(json.dumps(release))
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass
+
+
+def _fetch_latest_release(cached: Optional[dict]) -> dict:
+    """
+    Fetch latest release info from GitHub.
+
+    Sends the cached ETag so an unchanged release comes back as a 304,
+    which doesn't count against the unauthenticated rate limit.
+    """
+    import urllib.error
+    import urllib.request
+
+    url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+    headers = {'User-Agent': 'Claudia', 'Accept': 'application/vnd.github+json'}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    req = urllib.request.Request(url, headers=headers)
+
+    # Try different SSL approaches
+    ssl_context = None
+    ssl_warning = False
+
+    try:
+        import ssl
+        ssl_context = _get_ssl_context()
+        if ssl_context.verify_mode == ssl.CERT_NONE:
+            ssl_warning = True
+    except Exception:
+        pass
+
+    if ssl_warning:
+        print("  (SSL verification disabled - install certifi for secure updates)")
+        print("  pip install certifi")
+        print()
+
+    try:
+        with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response:
+            data = json.load(response)
+            return {
+                'tag_name': data.get('tag_name', ''),
+                'etag': response.headers.get('ETag'),
+            }
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            return cached
+        raise
+
+
 def cmd_update(args):
     """Check for updates or upgrade Claudia."""
+    import urllib.error
+
     print(f"Current version: {__version__}")
 
     if args.check:
-        # Check GitHub for latest release
-        url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-        req = urllib.request.Request(url, headers={'User-Agent': 'Claudia'})
-
-        # Try different SSL approaches
-        ssl_context = None
-        ssl_warning = False
+        cache_file = _update_cache_file()
+        cached = _read_update_cache(cache_file)
 
         try:
-            import ssl
-            ssl_context = _get_ssl_context()
-            if ssl_context.verify_mode == ssl.CERT_NONE:
-                ssl_warning = True
-        except Exception:
-            pass
+            cache_age = time.time() - cache_file.stat().st_mtime
+        except OSError:
+            cache_age = None
 
-        try:
-            with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response:
-                data = json.loads(response.read().decode())
-                latest = data.get('tag_name', '').lstrip('v')
-
-                if ssl_warning:
-                    print("  (SSL verification disabled - install certifi for secure updates)")
-                    print("  pip install certifi")
-                    print()
-
-                if latest and latest != __version__:
-                    print(f"New version available: {latest}")
-                    print("\nTo upgrade:")
-                    print(f"  pip install --upgrade git+https://github.com/{GITHUB_REPO}.git")
-                elif latest:
-                    print("You're on the latest version!")
+        if cached and cache_age is not None and cache_age < UPDATE_CACHE_TTL and not args.refresh:
+            release = cached
+        else:
+            try:
+                release = _fetch_latest_release(cached)
+            except urllib.error.URLError as e:
+                if 'SSL' in str(e) or 'certificate' in str(e).lower():
+                    print("SSL certificate error. To fix:")
+                    print("  pip install 'claudia[ssl]'")
+                    print("  # or: pip install certifi")
                 else:
-                    print("No releases found yet")
-
-        except urllib.error.URLError as e:
-            if 'SSL' in str(e) or 'certificate' in str(e).lower():
-                print("SSL certificate error. To fix:")
-                print("  pip install 'claudia[ssl]'")
-                print("  # or: pip install certifi")
-            else:
-                print(f"Could not check for updates: {e}")
-            return 1
-        except Exception as e:
-            print(f"Error checking for updates: {e}")
-            return 1
+                    print(f"Could not check for updates: {e}")
+                return 1
+            except Exception as e:
+                print(f"Error checking for updates: {e}")
+                return 1
+            # Rewrite even on 304 so the mtime restarts the TTL
+            _write_update_cache(cache_file, release)
+
+        latest = release.get('tag_name', '').lstrip('v')
+        if latest and latest != __version__:
+            print(f"New version available: {latest}")
+            print("\nTo upgrade:")
+            print(f"  pip install --upgrade git+https://github.com/{GITHUB_REPO}.git")
+        elif latest:
+            print("You're on the latest version!")
+        else:
+            print("No releases found yet")
     else:
         print("\nUsage:")
         print("  claudia update --check     Check for new versions")
@@ -448,6 +577,10 @@ def cmd_update(args):
 # Interactive Mode
 # ============================================================================
 
+_VALID_PRIORITY_INPUTS = frozenset({'0', '1', '2', '3'})
+_DECLINE_INPUTS = frozenset({'n', 'no'})
+
+
 def _interactive_create(agent, use_json):
     """Guided task creation wizard with prompts."""
     print("\n━━━ Create New Task ━━━\n")
@@ -466,7 +599,7 @@ def _interactive_create(agent, use_json):
     print("  2) P2 - Medium (default)")
     print("  3) P3 - Low (nice to have)")
     priority_input = input("Select priority [2]: ").strip()
-    if priority_input in ('0', '1', '2', '3'):
+    if priority_input in _VALID_PRIORITY_INPUTS:
         priority = int(priority_input)
     else:
         priority = 2
@@ -513,7 +646,7 @@ def _interactive_create(agent, use_json):
         print(f"  Description: {preview}")
 
     confirm = input("\nCreate this task? [Y/n]: ").strip().lower()
-    if confirm in ('n', 'no'):
+    if confirm in _DECLINE_INPUTS:
         print("Cancelled.")
         return None
 
@@ -526,7 +659,7 @@ def _interactive_create(agent, use_json):
     )
 
     if use_json:
-        print(json.dumps(task, indent=2))
+        _print_json(task)
     else:
         print(f"\n✓ Created {_format_task_short(task)}")
 
@@ -537,11 +670,11 @@ def _interactive_create(agent, use_json):
 # Task Commands (from original agent.py)
 # ============================================================================
 
-def cmd_status(args, agent, use_json):
+def cmd_status(args, agent, use_json, dry_run=False):
     """Show system status."""
     status = agent.get_status()
     if use_json:
-        print(json.dumps(status, indent=2))
+        _print_json(status)
     else:
         mode = status.get('mode', 'single')
         total = status.get('total_tasks', 0)
@@ -555,81 +688,80 @@ def cmd_status(args, agent, use_json):
         print(f"Sessions: {sessions} active")
 
 
-def cmd_tasks(args, agent, use_json):
+def cmd_tasks(args, agent, use_json, dry_run=False):
     """List tasks."""
     tasks = agent.get_tasks(status=args.status)
 
     # Apply search filter if provided
-    search_term = getattr(args, 'search', None)
-    if search_term:
-        search_lower = search_term.lower()
-        tasks = [
-            t for t in tasks
-            if search_lower in t.get('title', '').lower()
-            or search_lower in t.get('description', '').lower()
-        ]
+    search_terms = args.search
+    if search_terms:
+        tasks = _search_tasks(tasks, search_terms)
 
     if use_json:
-        print(json.dumps(tasks, indent=2))
+        _print_json(tasks)
     else:
         if not tasks:
-            if search_term:
-                print(f"No tasks matching '{search_term}'")
+            if search_terms:
+                print(f"No tasks matching {', '.join(repr(term) for term in search_terms)}")
             else:
                 print("No tasks found")
         else:
+            color_on = COLORS_ENABLED
+            out = []
             for task in tasks:
                 status = task.get('status', 'open')
-                status_display = _color_status(status) if Colors.is_enabled() else status
-                print(f"  {_format_task_short(task)} [{status_display}]")
-            print(f"\n{len(tasks)} task(s)")
+                status_display = _color_status(status) if color_on else status
+                out.append(f"  {_format_task_short(task, use_color=color_on)} [{status_display}]")
+            out.append(f"\n{len(tasks)} task(s)")
+            sys.stdout.write('\n'.join(out) + '\n')
 
 
-def cmd_show(args, agent, use_json):
+def cmd_show(args, agent, use_json, dry_run=False):
     """Show task details."""
-    tasks = agent.get_tasks()
-    task = next((t for t in tasks if t['id'] == args.task_id), None)
+    task = agent.get_task(args.task_id)
 
     if not task:
         print(f"✗ Task '{args.task_id}' not found")
         return
 
     if use_json:
-        print(json.dumps(task, indent=2))
+        _print_json(task)
     else:
-        print(f"\n{task['id']}: \"{task.get('title', 'Untitled')}\"")
-        print("━" * 50)
+        # Build the whole view and write it once rather than print() per line
+        out = []
+        out.append(f"\n{task['id']}: \"{task.get('title', 'Untitled')}\"")
+        out.append("━" * 50)
 
         status = task.get('status', 'open')
         assignee = task.get('assignee')
         status_line = f"Status:      {status}"
         if assignee:
             status_line += f" (assigned to {assignee})"
-        print(status_line)
+        out.append(status_line)
 
         priority = task.get('priority', 2)
-        print(f"Priority:    {_format_priority(priority)}")
+        out.append(f"Priority:    {_format_priority(priority)}")
 
         labels = task.get('labels', [])
         if labels:
-            print(f"Labels:      {', '.join(labels)}")
+            out.append(f"Labels:      {', '.join(labels)}")
 
         created = task.get('created_at', '')
         if created:
-            print(f"Created:     {_format_duration(created)} ago")
+            out.append(f"Created:     {_format_duration(created)} ago")
 
         blocked_by = task.get('blocked_by', [])
         if blocked_by:
-            print(f"Blocked by:  {', '.join(blocked_by)}")
+            out.append(f"Blocked by:  {', '.join(blocked_by)}")
 
         branch = task.get('branch')
         if branch:
-            print(f"Branch:      {branch}")
+            out.append(f"Branch:      {branch}")
 
         # v2: Show parent task if this is a subtask
         parent_id = task.get('parent_id')
         if parent_id:
-            print(f"Parent:      {parent_id}")
+            out.append(f"Parent:      {parent_id}")
 
         # v2: Show subtask progress if this task has subtasks
         subtasks = task.get('subtasks', [])
@@ -639,32 +771,32 @@ def cmd_show(args, agent, use_json):
                 pct = progress.get('percentage', 0)
                 total = progress.get('total', 0)
                 completed = progress.get('completed', 0)
-                print(f"Subtasks:    {completed}/{total} completed ({pct}%)")
+                out.append(f"Subtasks:    {completed}/{total} completed ({pct}%)")
 
         description = task.get('description', '')
         if description:
-            print("\nDescription:")
-            for line in description.split('\n'):
-                print(f"  {line}")
+            out.append("\nDescription:")
+            out.extend(f"  {line}" for line in description.split('\n'))
 
         notes = task.get('notes', [])
         if notes:
-            print(f"\nHistory ({len(notes)} entries):")
+            out.append(f"\nHistory ({len(notes)} entries):")
             for note in notes[-10:]:
                 timestamp = note.get('timestamp', '')
                 time_str = _format_duration(timestamp) + " ago" if timestamp else "?"
                 note_text = note.get('note', '')
-                print(f"  • {time_str:12} {note_text}")
+                out.append(f"  • {time_str:12} {note_text}")
             if len(notes) > 10:
-                print(f"  ... and {len(notes) - 10} earlier entries")
+                out.append(f"  ... and {len(notes) - 10} earlier entries")
 
-        print()
+        out.append('')
+        sys.stdout.write('\n'.join(out) + '\n')
 
 
 def cmd_create(args, agent, use_json, dry_run):
     """Create a task."""
     # Check for interactive mode
-    interactive = getattr(args, 'interactive', False)
+    interactive = args.interactive
     if interactive:
         _interactive_create(agent, use_json)
         return
@@ -675,7 +807,7 @@ def cmd_create(args, agent, use_json, dry_run):
         return
 
     # Check if creating from template
-    template_id = getattr(args, 'template', None)
+    template_id = args.template
 
     if template_id:
         # Create from template
@@ -701,7 +833,7 @@ def cmd_create(args, agent, use_json, dry_run):
         )
 
         if use_json:
-            print(json.dumps(task, indent=2))
+            _print_json(task)
         elif task:
             subtask_count = len(task.get('subtasks', []))
             print(f"✓ Created {_format_task_short(task)} from template {template_id}")
@@ -728,7 +860,7 @@ def cmd_create(args, agent, use_json, dry_run):
         labels=args.labels,
     )
     if use_json:
-        print(json.dumps(task, indent=2))
+        _print_json(task)
     else:
         print(f"✓ Created {_format_task_short(task)}")
 
@@ -736,37 +868,45 @@ def cmd_create(args, agent, use_json, dry_run):
 def cmd_next(args, agent, use_json, dry_run):
     """Get next task."""
     if dry_run:
-        tasks = agent.get_tasks(status='open')
-        task_map = {t['id']: t for t in agent.get_tasks()}
-        ready = [t for t in tasks if is_task_ready(t, task_map) and t.get('assignee') is None]
+        from claudia.agent import is_task_ready
+
+        tasks = agent.get_tasks()
+        task_map = {t['id']: t for t in tasks}
+        # is_task_ready already rejects non-open and assigned tasks
+        ready = [t for t in tasks if is_task_ready(t, task_map)]
 
         if args.labels:
+            preferred = frozenset(args.labels)
+
             def score(t):
-                label_match = -len(set(t.get('labels', [])) & set(args.labels))
+                label_match = -len(preferred.intersection(t.get('labels') or ()))
                 return (t.get('priority', 2), label_match, t.get('created_at', ''))
-            ready.sort(key=score)
         else:
-            ready.sort(key=lambda t: (t.get('priority', 2), t.get('created_at', '')))
+            def score(t):
+                return (t.get('priority', 2), t.get('created_at', ''))
 
         if ready:
-            task = ready[0]
+            # Only the best candidate is needed; min() is a single pass and,
+            # like a stable sort, returns the first of equal-scored tasks
+            task = min(ready, key=score)
             print(f"Would claim: {_format_task_short(task)}")
             print("  Status would change: open → in_progress")
             if task.get('description'):
                 print(f"  Description: {task['description'][:80]}...")
         else:
-            status = agent.get_status()
-            summary = _format_task_status_summary(
-                status.get('tasks_by_status', {}),
-                status.get('ready_tasks', 0)
-            )
-            print(f"No ready tasks. ({summary})")
+            # Summarize from the list already loaded; get_status() would reload
+            # it and also clean up stale sessions, which a dry run shouldn't do
+            by_status = {}
+            for t in tasks:
+                status = t.get('status', 'open')
+                by_status[status] = by_status.get(status, 0) + 1
+            print(f"No ready tasks. ({_format_task_status_summary(by_status, 0)})")
         return
 
     task = agent.get_next_task(preferred_labels=args.labels)
     if task:
         if use_json:
-            print(json.dumps(task, indent=2))
+            _print_json(task)
         else:
             print(f"✓ Claimed {_format_task_short(task)}")
             if task.get('description'):
@@ -780,21 +920,35 @@ def cmd_next(args, agent, use_json, dry_run):
         print(f"No ready tasks. ({summary})")
 
 
+def _task_label(task_map: dict, task_id: str) -> str:
+    """Format a task from task_map as a one-liner, or fall back to its bare ID."""
+    task = task_map.get(task_id)
+    return _format_task_short(task) if task else task_id
+
+
+def _last_claimed_at(task: dict) -> Optional[str]:
+    """Return the timestamp of the task's most recent claim note, if any."""
+    # Claims are appended, so the latest one is found fastest from the end
+    for note in reversed(task.get('notes', [])):
+        if note.get('note', '').startswith('Claimed'):
+            return note.get('timestamp')
+    return None
+
+
 def cmd_complete(args, agent, use_json, dry_run):
     """Complete one or more tasks."""
     task_ids = args.task_ids
-    tasks = agent.get_tasks()
-    task_map = {t['id']: t for t in tasks}
-    force = getattr(args, 'force', False)
+    force = args.force
 
     # Single task: use original detailed behavior
     if len(task_ids) == 1:
         task_id = task_ids[0]
-        task_info = task_map.get(task_id)
+        task_info = agent.get_task(task_id)
 
         if not task_info:
             print(f"✗ Task '{task_id}' not found")
-            open_tasks = [t for t in tasks if t.get('status') in ('open', 'in_progress')]
+            # Only a miss needs the full list, for the suggestions
+            open_tasks = [t for t in agent.get_tasks() if t.get('status') in ('open', 'in_progress')]
             if open_tasks:
                 print("\nAvailable tasks:")
                 for t in open_tasks[:5]:
@@ -803,6 +957,8 @@ def cmd_complete(args, agent, use_json, dry_run):
                     print(f"  ... and {len(open_tasks) - 5} more")
             return
 
+        claimed_at = _last_claimed_at(task_info)
+
         if dry_run:
             current_status = task_info.get('status', 'open')
             print(f"Would complete: {_format_task_short(task_info)}")
@@ -817,22 +973,16 @@ def cmd_complete(args, agent, use_json, dry_run):
                     print(f"  Warning: {progress['total'] - progress['completed']} subtask(s) not complete")
                     if not force:
                         print("  Use --force to complete anyway")
-            for note in task_info.get('notes', []):
-                if 'Claimed' in note.get('note', ''):
-                    print(f"  Duration: {_format_duration(note['timestamp'])}")
-                    break
+            if claimed_at:
+                print(f"  Duration: {_format_duration(claimed_at)}")
             return
 
         result = agent.complete_task(task_id, note=args.note, force=force)
 
         if use_json:
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         elif result.get('success'):
-            duration = ""
-            for note in task_info.get('notes', []):
-                if 'Claimed' in note.get('note', ''):
-                    duration = f" (was in_progress for {_format_duration(note['timestamp'])})"
-                    break
+            duration = f" (was in_progress for {_format_duration(claimed_at)})" if claimed_at else ""
             print(f"✓ Completed {_format_task_short(task_info)}{duration}")
         elif result.get('error') == 'incomplete_subtasks':
             incomplete = result.get('incomplete_subtasks', [])
@@ -853,6 +1003,7 @@ def cmd_complete(args, agent, use_json, dry_run):
         return
 
     # Multiple tasks: use bulk operation
+    task_map = agent.get_tasks_by_ids(task_ids)
     if dry_run:
         print(f"Would complete {len(task_ids)} task(s):")
         for task_id in task_ids:
@@ -868,7 +1019,7 @@ def cmd_complete(args, agent, use_json, dry_run):
     result = agent.bulk_complete(task_ids, note=args.note, force=force)
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result)
     else:
         succeeded = result.get('succeeded', [])
         failed = result.get('failed', [])
@@ -876,37 +1027,22 @@ def cmd_complete(args, agent, use_json, dry_run):
         if succeeded:
             print(f"✓ Completed {len(succeeded)} task(s):")
             for tid in succeeded:
-                task_info = task_map.get(tid)
-                if task_info:
-                    print(f"  • {_format_task_short(task_info)}")
-                else:
-                    print(f"  • {tid}")
+                print(f"  • {_task_label(task_map, tid)}")
 
         if failed:
             print(f"\n✗ Failed to complete {len(failed)} task(s):")
             for f in failed:
-                tid = f.get('id')
                 error = f.get('error', 'Unknown error')
-                task_info = task_map.get(tid)
                 if error == 'incomplete_subtasks':
-                    incomplete = f.get('incomplete_subtasks', [])
-                    if task_info:
-                        print(f"  • {_format_task_short(task_info)}: {len(incomplete)} subtask(s) not complete")
-                    else:
-                        print(f"  • {tid}: {len(incomplete)} subtask(s) not complete")
-                else:
-                    if task_info:
-                        print(f"  • {_format_task_short(task_info)}: {error}")
-                    else:
-                        print(f"  • {tid}: {error}")
+                    error = f"{len(f.get('incomplete_subtasks', ()))} subtask(s) not complete"
+                print(f"  • {_task_label(task_map, f.get('id'))}: {error}")
             if any(f.get('error') == 'incomplete_subtasks' for f in failed):
                 print("\nUse --force to complete tasks with incomplete subtasks")
 
 
 def cmd_edit(args, agent, use_json, dry_run):
     """Edit a task."""
-    tasks = agent.get_tasks()
-    task_info = next((t for t in tasks if t['id'] == args.task_id), None)
+    task_info = agent.get_task(args.task_id)
 
     if not task_info:
         print(f"✗ Task '{args.task_id}' not found")
@@ -938,7 +1074,7 @@ def cmd_edit(args, agent, use_json, dry_run):
     )
 
     if use_json:
-        print(json.dumps(task or {'error': 'Task not found'}, indent=2))
+        _print_json(task or {'error': 'Task not found'})
     elif task:
         print(f"✓ Updated {_format_task_short(task)}")
     else:
@@ -947,8 +1083,7 @@ def cmd_edit(args, agent, use_json, dry_run):
 
 def cmd_delete(args, agent, use_json, dry_run):
     """Delete a task."""
-    tasks = agent.get_tasks()
-    task_info = next((t for t in tasks if t['id'] == args.task_id), None)
+    task_info = agent.get_task(args.task_id)
 
     if not task_info:
         print(f"✗ Task '{args.task_id}' not found")
@@ -967,7 +1102,7 @@ def cmd_delete(args, agent, use_json, dry_run):
     result = agent.delete_task(args.task_id, force=args.force)
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result)
     elif result.get('success'):
         deleted_subtasks = result.get('deleted_subtasks', [])
         if deleted_subtasks:
@@ -988,13 +1123,11 @@ def cmd_delete(args, agent, use_json, dry_run):
 def cmd_reopen(args, agent, use_json, dry_run):
     """Reopen one or more tasks."""
     task_ids = args.task_ids
-    tasks = agent.get_tasks()
-    task_map = {t['id']: t for t in tasks}
 
     # Single task: use original detailed behavior
     if len(task_ids) == 1:
         task_id = task_ids[0]
-        task_info = task_map.get(task_id)
+        task_info = agent.get_task(task_id)
 
         if not task_info:
             print(f"✗ Task '{task_id}' not found")
@@ -1015,7 +1148,7 @@ def cmd_reopen(args, agent, use_json, dry_run):
         success = agent.reopen_task(task_id, note=args.note)
 
         if use_json:
-            print(json.dumps({'success': success, 'task_id': task_id}, indent=2))
+            _print_json({'success': success, 'task_id': task_id})
         elif success:
             print(f"✓ Reopened {_format_task_short(task_info)} (was {old_status})")
         else:
@@ -1023,6 +1156,7 @@ def cmd_reopen(args, agent, use_json, dry_run):
         return
 
     # Multiple tasks: use bulk operation
+    task_map = agent.get_tasks_by_ids(task_ids)
     if dry_run:
         print(f"Would reopen {len(task_ids)} task(s):")
         for task_id in task_ids:
@@ -1039,7 +1173,7 @@ def cmd_reopen(args, agent, use_json, dry_run):
     result = agent.bulk_reopen(task_ids, note=args.note)
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result)
     else:
         succeeded = result.get('succeeded', [])
         failed = result.get('failed', [])
@@ -1047,22 +1181,12 @@ def cmd_reopen(args, agent, use_json, dry_run):
         if succeeded:
             print(f"✓ Reopened {len(succeeded)} task(s):")
             for tid in succeeded:
-                task_info = task_map.get(tid)
-                if task_info:
-                    print(f"  • {_format_task_short(task_info)}")
-                else:
-                    print(f"  • {tid}")
+                print(f"  • {_task_label(task_map, tid)}")
 
         if failed:
             print(f"\n✗ Failed to reopen {len(failed)} task(s):")
             for f in failed:
-                tid = f.get('id')
-                error = f.get('error', 'Unknown error')
-                task_info = task_map.get(tid)
-                if task_info:
-                    print(f"  • {_format_task_short(task_info)}: {error}")
-                else:
-                    print(f"  • {tid}: {error}")
+                print(f"  • {_task_label(task_map, f.get('id'))}: {f.get('error', 'Unknown error')}")
 
 
 def cmd_archive(args, agent, use_json, dry_run):
@@ -1071,7 +1195,7 @@ def cmd_archive(args, agent, use_json, dry_run):
         result = agent.archive_tasks(days_old=args.days, dry_run=dry_run)
 
         if use_json:
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         elif result.get('error'):
             print(f"✗ {result['error']}")
         elif dry_run:
@@ -1095,7 +1219,7 @@ def cmd_archive(args, agent, use_json, dry_run):
         tasks = agent.list_archived(limit=args.limit)
 
         if use_json:
-            print(json.dumps(tasks, indent=2))
+            _print_json(tasks)
         elif not tasks:
             print("No archived tasks")
         else:
@@ -1106,13 +1230,16 @@ def cmd_archive(args, agent, use_json, dry_run):
 
     elif args.archive_command == 'restore':
         if dry_run:
-            print(f"Would restore {args.task_id} from archive")
+            if agent.is_archived(args.task_id):
+                print(f"Would restore {args.task_id} from archive")
+            else:
+                print(f"✗ Task '{args.task_id}' not found in archive")
             return
 
         task = agent.restore_from_archive(args.task_id)
 
         if use_json:
-            print(json.dumps(task, indent=2))
+            _print_json(task)
         elif task:
             print(f"✓ Restored {_format_task_short(task)}")
         else:
@@ -1124,9 +1251,8 @@ def cmd_archive(args, agent, use_json, dry_run):
 
 def _format_time(seconds: float) -> str:
     """Format seconds as human-readable time."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    hours, rem = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rem, 60)
     if hours > 0:
         return f"{hours}h {minutes}m {secs}s"
     elif minutes > 0:
@@ -1134,6 +1260,15 @@ def _format_time(seconds: float) -> str:
     return f"{secs}s"
 
 
+# Row formatter per `time report --by` value, chosen once per report
+_TIME_REPORT_ROW = {
+    'task': lambda item: (f"  {item['id']}: {item['title'][:30]}\n"
+                          f"    {_format_time(item['seconds'])} ({item['hours']}h)"),
+    'label': lambda item: f"  [{item['label']}] {_format_time(item['seconds'])} ({item['hours']}h)",
+    'day': lambda item: f"  {item['day']}: {_format_time(item['seconds'])} ({item['hours']}h)",
+}
+
+
 def cmd_time(args, agent, use_json, dry_run):
     """Time tracking commands."""
     if args.time_command == 'start':
@@ -1143,7 +1278,7 @@ def cmd_time(args, agent, use_json, dry_run):
 
         task = agent.start_timer(args.task_id)
         if use_json:
-            print(json.dumps(task, indent=2))
+            _print_json(task)
         elif task:
             print(f"✓ Timer started for {_format_task_short(task)}")
         else:
@@ -1156,7 +1291,7 @@ def cmd_time(args, agent, use_json, dry_run):
 
         task = agent.stop_timer(args.task_id)
         if use_json:
-            print(json.dumps(task, indent=2))
+            _print_json(task)
         elif task:
             tt = task.get('time_tracking', {})
             total = tt.get('total_seconds', 0)
@@ -1172,7 +1307,7 @@ def cmd_time(args, agent, use_json, dry_run):
 
         task = agent.pause_timer(args.task_id)
         if use_json:
-            print(json.dumps(task, indent=2))
+            _print_json(task)
         elif task:
             tt = task.get('time_tracking', {})
             total = tt.get('total_seconds', 0)
@@ -1185,7 +1320,7 @@ def cmd_time(args, agent, use_json, dry_run):
         info = agent.get_task_time(args.task_id)
 
         if use_json:
-            print(json.dumps(info, indent=2))
+            _print_json(info)
         elif info:
             total = info.get('total_seconds', 0)
             current = info.get('current_elapsed', 0)
@@ -1214,25 +1349,18 @@ def cmd_time(args, agent, use_json, dry_run):
         )
 
         if use_json:
-            print(json.dumps(report, indent=2))
+            _print_json(report)
         else:
-            print(f"Time Report (by {args.by})")
-            print("=" * 50)
+            out = [f"Time Report (by {args.by})", "=" * 50]
 
             if not report.get('items'):
-                print("No time tracked yet.")
+                out.append("No time tracked yet.")
             else:
-                for item in report['items']:
-                    if args.by == 'task':
-                        print(f"  {item['id']}: {item['title'][:30]}")
-                        print(f"    {_format_time(item['seconds'])} ({item['hours']}h)")
-                    elif args.by == 'label':
-                        print(f"  [{item['label']}] {_format_time(item['seconds'])} ({item['hours']}h)")
-                    elif args.by == 'day':
-                        print(f"  {item['day']}: {_format_time(item['seconds'])} ({item['hours']}h)")
-
-            print("-" * 50)
-            print(f"Total: {_format_time(report['total_seconds'])} ({report['total_hours']}h)")
+                out.extend(_TIME_REPORT_ROW[args.by](item) for item in report['items'])
+
+            out.append("-" * 50)
+            out.append(f"Total: {_format_time(report['total_seconds'])} ({report['total_hours']}h)")
+            sys.stdout.write('\n'.join(out) + '\n')
 
     else:
         print("Usage: claudia time <start|stop|pause|status|report> ...")
@@ -1244,7 +1372,7 @@ def cmd_template(args, agent, use_json, dry_run):
         templates = agent.list_templates()
 
         if use_json:
-            print(json.dumps(templates, indent=2))
+            _print_json(templates)
         else:
             if not templates:
                 print("No templates found. Create one with 'claudia template create <name>'")
@@ -1282,7 +1410,7 @@ def cmd_template(args, agent, use_json, dry_run):
         )
 
         if use_json:
-            print(json.dumps(template, indent=2))
+            _print_json(template)
         else:
             subtask_count = len(template.get('subtasks', []))
             print(f"✓ Created template {template['id']}: {template['name']}")
@@ -1301,7 +1429,7 @@ def cmd_template(args, agent, use_json, dry_run):
         success = agent.delete_template(args.template_id)
 
         if use_json:
-            print(json.dumps({'success': success}, indent=2))
+            _print_json({'success': success})
         elif success:
             print(f"✓ Deleted template {args.template_id}")
         else:
@@ -1311,7 +1439,7 @@ def cmd_template(args, agent, use_json, dry_run):
         template = agent.get_template(args.template_id)
 
         if use_json:
-            print(json.dumps(template, indent=2))
+            _print_json(template)
         elif template:
             print(f"Template: {template['id']}")
             print(f"Name:     {template['name']}")
@@ -1358,7 +1486,7 @@ def cmd_subtask(args, agent, use_json, dry_run):
 
         if subtask:
             if use_json:
-                print(json.dumps(subtask, indent=2))
+                _print_json(subtask)
             else:
                 print(f"✓ Created subtask {_format_task_short(subtask)}")
                 print(f"  Parent: {args.parent_id}")
@@ -1369,15 +1497,16 @@ def cmd_subtask(args, agent, use_json, dry_run):
         subtasks = agent.get_subtasks(args.task_id)
 
         if use_json:
-            print(json.dumps(subtasks, indent=2))
+            _print_json(subtasks)
         else:
             if not subtasks:
                 print(f"No subtasks for {args.task_id}")
             else:
                 print(f"Subtasks of {args.task_id}:")
+                color_on = COLORS_ENABLED
                 for st in subtasks:
                     status = st.get('status', 'open')
-                    status_display = _color_status(status) if Colors.is_enabled() else status
+                    status_display = _color_status(status) if color_on else status
                     print(f"  {_format_task_short(st)} [{status_display}]")
                 print(f"\n{len(subtasks)} subtask(s)")
 
@@ -1389,7 +1518,7 @@ def cmd_subtask(args, agent, use_json, dry_run):
             return
 
         if use_json:
-            print(json.dumps(progress, indent=2))
+            _print_json(progress)
         else:
             total = progress.get('total', 0)
             if total == 0:
@@ -1414,18 +1543,91 @@ def cmd_subtask(args, agent, use_json, dry_run):
         print("Usage: claudia subtask <create|list|progress> ...")
 
 
-def _get_session_age_seconds(session: dict) -> float:
-    """Get seconds since last heartbeat for a session."""
+def _scan_session_files(sessions_dir: Path) -> list:
+    """Return os.DirEntry objects for session-*.json files in sessions_dir."""
+    # scandir entries carry their stat info, so callers can check mtimes
+    # without another syscall per file
+    with os.scandir(sessions_dir) as it:
+        return [e for e in it if e.name.startswith('session-') and e.name.endswith('.json')]
+
+
+# Below this many files, starting a thread pool costs more than it overlaps
+_SESSION_POOL_MIN = 32
+
+
+def _read_session_file(path: str) -> Optional[dict]:
+    """Load one session file, or None if it is unreadable or corrupt."""
+    try:
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _read_session_files(entries: list) -> list:
+    """Load session files in order, None for each unreadable one.
+
+    Large directories are read on a small thread pool so the file I/O
+    overlaps; the GIL is released while waiting on open/read.
+    """
+    paths = [e.path for e in entries]
+    if len(paths) < _SESSION_POOL_MIN:
+        return [_read_session_file(p) for p in paths]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+        return list(pool.map(_read_session_file, paths))
+
+
+def _unlink_session_files(entries: list) -> None:
+    """Delete session files, on a thread pool for large batches."""
+    paths = [e.path for e in entries]
+    if len(paths) < _SESSION_POOL_MIN:
+        for path in paths:
+            os.unlink(path)
+        return
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(16, len(paths))) as pool:
+        # list() surfaces the first failure, as the serial loop would
+        list(pool.map(os.unlink, paths))
+
+
+def _get_session_age_seconds(session: dict, now_ts: Optional[float] = None) -> float:
+    """Get seconds since last heartbeat for a session.
+
+    Pass ``now_ts`` (a ``time.time()`` value) when checking many sessions.
+    """
     hb_time = session.get('last_heartbeat', '')
     if not hb_time:
         return float('inf')
+    if now_ts is None:
+        now_ts = time.time()
+
+    # Fast path for the UTC stamps we write ourselves:
+    # YYYY-MM-DDTHH:MM:SS[.ffffff] followed by Z, +00:00 or +00:00Z
+    body = hb_time[:-1] if hb_time.endswith('Z') else hb_time
+    if body.endswith('+00:00'):
+        body = body[:-6]
+    if len(body) in (19, 26) and body[10] == 'T':
+        import calendar
+        try:
+            epoch = calendar.timegm((
+                int(body[0:4]), int(body[5:7]), int(body[8:10]),
+                int(body[11:13]), int(body[14:16]), int(body[17:19]), 0, 0, 0,
+            ))
+            if len(body) == 26:
+                epoch += int(body[20:]) / 1e6
+            return now_ts - epoch
+        except ValueError:
+            pass
+
+    from datetime import datetime, timezone
     try:
         if hb_time.endswith('Z'):
             hb_time = hb_time[:-1] + '+00:00'
         dt = datetime.fromisoformat(hb_time)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
-        return (datetime.now(timezone.utc) - dt).total_seconds()
+        return now_ts - dt.timestamp()
     except (ValueError, TypeError):
         return float('inf')
 
@@ -1434,33 +1636,44 @@ def cmd_session(args, agent, use_json, dry_run=False):
     """Show session info or manage sessions."""
     sessions_dir = agent.state_dir / 'sessions'
 
-    # Handle cleanup subcommand (can be triggered by subparser or session_id='cleanup')
-    session_command = getattr(args, 'session_command', None)
-    session_id_arg = getattr(args, 'session_id', None)
+    # 'claudia session cleanup' arrives as the reserved session_id 'cleanup'
+    session_id_arg = args.session_id
 
-    # Support both 'claudia session cleanup' via subparser and positional arg
-    if session_command == 'cleanup' or session_id_arg == 'cleanup':
-        threshold = getattr(args, 'threshold', 180)  # 3 minutes default
+    if session_id_arg == 'cleanup':
+        threshold = args.threshold
 
         if not sessions_dir.exists():
             print("No sessions directory")
             return
 
-        session_files = list(sessions_dir.glob('session-*.json'))
+        session_files = _scan_session_files(sessions_dir)
         if not session_files:
             print("No sessions to clean up")
             return
 
+        now = time.time()
         stale_sessions = []
-        for sf in session_files:
-            try:
-                session = json.loads(sf.read_text())
-                age = _get_session_age_seconds(session)
-                if age > threshold:
-                    stale_sessions.append((sf, session, age))
-            except (json.JSONDecodeError, OSError):
+        to_parse = []
+        for entry in session_files:
+            # Heartbeats are written into the file, so its mtime bounds the
+            # heartbeat age from below: old enough means stale without parsing.
+            # Dry runs still parse to report the real heartbeat age.
+            mtime_age = now - entry.stat().st_mtime
+            if mtime_age > threshold and not dry_run:
+                sid = entry.name[len('session-'):-len('.json')]
+                stale_sessions.append((entry, {'session_id': sid}, mtime_age))
+            else:
+                to_parse.append(entry)
+
+        for entry, session in zip(to_parse, _read_session_files(to_parse)):
+            if session is None:
                 # Corrupt file, mark for cleanup
-                stale_sessions.append((sf, {'session_id': sf.stem.replace('session-', '')}, float('inf')))
+                sid = entry.name[len('session-'):-len('.json')]
+                stale_sessions.append((entry, {'session_id': sid}, float('inf')))
+                continue
+            age = _get_session_age_seconds(session, now)
+            if age > threshold:
+                stale_sessions.append((entry, session, age))
 
         if not stale_sessions:
             print(f"No stale sessions (threshold: {threshold}s)")
@@ -1468,24 +1681,20 @@ def cmd_session(args, agent, use_json, dry_run=False):
 
         if dry_run:
             print(f"Would remove {len(stale_sessions)} stale session(s):")
-            for sf, session, age in stale_sessions:
+            for entry, session, age in stale_sessions:
                 sid = session.get('session_id', 'unknown')
                 age_str = f"{int(age)}s" if age != float('inf') else "corrupt"
                 print(f"  • {sid} (last heartbeat: {age_str} ago)")
             return
 
+        _unlink_session_files([entry for entry, _, _ in stale_sessions])
         if use_json:
-            removed = []
-            for sf, session, age in stale_sessions:
-                sf.unlink()
-                removed.append(session.get('session_id', sf.stem))
-            print(json.dumps({'removed': removed, 'count': len(removed)}, indent=2))
+            removed = [session.get('session_id', entry.name) for entry, session, _ in stale_sessions]
+            _print_json({'removed': removed, 'count': len(removed)})
         else:
             print(f"Removing {len(stale_sessions)} stale session(s):")
-            for sf, session, age in stale_sessions:
-                sid = session.get('session_id', 'unknown')
-                sf.unlink()
-                print(f"  ✓ {sid}")
+            for entry, session, age in stale_sessions:
+                print(f"  ✓ {session.get('session_id', 'unknown')}")
             print(f"\n✓ Cleaned up {len(stale_sessions)} session(s)")
         return
 
@@ -1496,12 +1705,14 @@ def cmd_session(args, agent, use_json, dry_run=False):
             print(f"✗ Session '{session_id_arg}' not found")
             return
 
-        session = json.loads(session_file.read_text())
+        session = _json_loads(session_file.read_bytes())
+        tasks = agent.get_tasks()
+        task_map = {t['id']: t for t in tasks}
+
         if use_json:
             working_on_details = []
-            tasks = agent.get_tasks()
             for tid in session.get('working_on', []):
-                task = next((t for t in tasks if t['id'] == tid), None)
+                task = task_map.get(tid)
                 if task:
                     working_on_details.append({
                         'id': tid,
@@ -1509,125 +1720,181 @@ def cmd_session(args, agent, use_json, dry_run=False):
                         'priority': task.get('priority', 2),
                     })
             session['working_on_details'] = working_on_details
-            print(json.dumps(session, indent=2))
+            _print_json(session)
         else:
-            print(f"\nSession: {session['session_id']}")
-            print("━" * 50)
-            print(f"Role:        {session.get('role', 'worker')}")
-            print(f"Context:     {session.get('context', 'No context')}")
+            out = []
+            out.append(f"\nSession: {session['session_id']}")
+            out.append("━" * 50)
+            out.append(f"Role:        {session.get('role', 'worker')}")
+            out.append(f"Context:     {session.get('context', 'No context')}")
             labels = session.get('labels', [])
             if labels:
-                print(f"Labels:      {', '.join(labels)}")
-            print(f"Started:     {_format_duration(session.get('started_at', ''))} ago")
-            print(f"Heartbeat:   {_format_duration(session.get('last_heartbeat', ''))} ago")
+                out.append(f"Labels:      {', '.join(labels)}")
+            out.append(f"Started:     {_format_duration(session.get('started_at', ''))} ago")
+            out.append(f"Heartbeat:   {_format_duration(session.get('last_heartbeat', ''))} ago")
 
             working_on = session.get('working_on', [])
             if working_on:
-                print(f"\nWorking on ({len(working_on)} tasks):")
-                tasks = agent.get_tasks()
+                out.append(f"\nWorking on ({len(working_on)} tasks):")
                 for tid in working_on:
-                    task = next((t for t in tasks if t['id'] == tid), None)
+                    task = task_map.get(tid)
                     if task:
-                        print(f"  • {_format_task_short(task)}")
+                        out.append(f"  • {_format_task_short(task)}")
                     else:
-                        print(f"  • {tid} (task not found)")
+                        out.append(f"  • {tid} (task not found)")
             else:
-                tasks = agent.get_tasks()
                 assigned = [t for t in tasks if t.get('assignee') == session_id_arg]
                 if assigned:
-                    print(f"\nAssigned tasks ({len(assigned)}):")
+                    out.append(f"\nAssigned tasks ({len(assigned)}):")
                     for task in assigned:
-                        print(f"  • {_format_task_short(task)}")
+                        out.append(f"  • {_format_task_short(task)}")
                 else:
-                    print("\nNo active tasks.")
-            print()
+                    out.append("\nNo active tasks.")
+            out.append('')
+            sys.stdout.write('\n'.join(out) + '\n')
     else:
         # List all sessions
         if not sessions_dir.exists():
             print("No sessions directory")
             return
 
-        session_files = list(sessions_dir.glob('session-*.json'))
+        session_files = _scan_session_files(sessions_dir)
         if not session_files:
             print("No active sessions")
             return
 
-        sessions = []
-        for sf in session_files:
-            try:
-                sessions.append(json.loads(sf.read_text()))
-            except (json.JSONDecodeError, OSError):
-                pass
+        sessions = [s for s in _read_session_files(session_files) if s is not None]
 
         if use_json:
-            print(json.dumps(sessions, indent=2))
+            _print_json(sessions)
         else:
-            print(f"\nActive Sessions ({len(sessions)}):")
-            print("━" * 50)
+            out = []
+            out.append(f"\nActive Sessions ({len(sessions)}):")
+            out.append("━" * 50)
+            from datetime import datetime, timezone
+            now = datetime.now(timezone.utc)
             for s in sessions:
                 working = len(s.get('working_on', []))
-                print(f"  {s['session_id']}: {s.get('context', 'No context')[:40]}")
+                out.append(f"  {s['session_id']}: {s.get('context', 'No context')[:40]}")
                 if s.get('labels'):
-                    print(f"    Labels: {', '.join(s['labels'])}")
-                print(f"    Working on: {working} task(s), heartbeat: {_format_duration(s.get('last_heartbeat', ''))} ago")
-            print("\nTip: Use 'claudia session <id>' for details")
-            print("     Use 'claudia session cleanup' to remove stale sessions")
+                    out.append(f"    Labels: {', '.join(s['labels'])}")
+                out.append(f"    Working on: {working} task(s), heartbeat: {_format_duration(s.get('last_heartbeat', ''), now)} ago")
+            out.append("\nTip: Use 'claudia session <id>' for details")
+            out.append("     Use 'claudia session cleanup' to remove stale sessions")
+            sys.stdout.write('\n'.join(out) + '\n')
+
+
+def cmd_start_parallel(args, agent, use_json, dry_run=False):
+    """Start parallel mode."""
+    success = agent.start_parallel_mode(port=args.port)
+    if success:
+        print(f"✓ Parallel mode started on port {args.port}")
+        print("  Workers can connect by running 'claudia' in new terminals")
+    else:
+        print("✗ Failed to start parallel mode")
 
 
-# ============================================================================
-# Main CLI
-# ============================================================================
+def cmd_stop_parallel(args, agent, use_json, dry_run=False):
+    """Stop parallel mode."""
+    success = agent.stop_parallel_mode()
+    if success:
+        print("✓ Parallel mode stopped")
+    else:
+        print("✗ Could not stop parallel mode")
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Claudia - Task coordination for Claude Code',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog='''
-Examples:
-  claudia init                    Initialize in current directory
-  claudia status                  Show system status
-  claudia create "Fix bug" -p 1   Create high-priority task
-  claudia next                    Claim next available task
-  claudia complete task-001       Complete a task
-  claudia update --check          Check for updates
-'''
+
+def _run_dashboard(args):
+    """Launch the terminal dashboard."""
+    from claudia import dashboard
+    dashboard.main(
+        state_dir=args.state_dir,
+        refresh=args.refresh,
+        once=args.once,
+        no_alt_screen=args.no_alt_screen,
     )
-    parser.add_argument('--version', action='version', version=f'claudia {__version__}')
-    parser.add_argument('--state-dir', default='.agent-state')
-    parser.add_argument('--json', action='store_true', help='Output in JSON format')
-    parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
-    parser.add_argument('--dry-run', action='store_true', help='Preview changes')
+    return 0
 
-    subparsers = parser.add_subparsers(dest='command')
 
-    # init
+def _run_docs(args):
+    """Run a documentation generation command."""
+    from claudia.docs import cmd_docs
+    return cmd_docs(args)
+
+
+# ============================================================================
+# Main CLI
+# ============================================================================
+
+# Commands that run without an Agent: handler(args) -> exit code
+STANDALONE_COMMANDS = {
+    'init': cmd_init,
+    'uninstall': cmd_uninstall,
+    'update': cmd_update,
+    'dashboard': _run_dashboard,
+    'docs': _run_docs,
+}
+
+# Commands that operate on task state: handler(args, agent, use_json, dry_run)
+AGENT_COMMANDS = {
+    'status': cmd_status,
+    'tasks': cmd_tasks,
+    'show': cmd_show,
+    'create': cmd_create,
+    'next': cmd_next,
+    'complete': cmd_complete,
+    'edit': cmd_edit,
+    'delete': cmd_delete,
+    'reopen': cmd_reopen,
+    'archive': cmd_archive,
+    'time': cmd_time,
+    'template': cmd_template,
+    'subtask': cmd_subtask,
+    'session': cmd_session,
+    'start-parallel': cmd_start_parallel,
+    'stop-parallel': cmd_stop_parallel,
+}
+
+
+# Subparser builders: each registers one top-level command. _build_parser()
+# only builds the one about to run; help and unknown commands build them all
+# so argparse can still list and validate every choice.
+
+def _add_init_parser(subparsers):
     init_p = subparsers.add_parser('init', help='Initialize Claudia in a project')
     init_p.add_argument('path', nargs='?', help='Path to initialize (default: current dir)')
     init_p.add_argument('--force', action='store_true', help='Force reinitialize')
 
-    # uninstall
+
+def _add_uninstall_parser(subparsers):
     uninstall_p = subparsers.add_parser('uninstall', help='Remove Claudia from a project')
     uninstall_p.add_argument('path', nargs='?', help='Path to uninstall from')
     uninstall_p.add_argument('--force', action='store_true', help='Skip confirmation')
     uninstall_p.add_argument('--keep-history', action='store_true', help='Backup task history')
 
-    # update
+
+def _add_update_parser(subparsers):
     update_p = subparsers.add_parser('update', help='Check for updates')
     update_p.add_argument('--check', action='store_true', help='Check GitHub for new version')
+    update_p.add_argument('--refresh', action='store_true', help='Ignore the cached release info')
+
 
-    # status
+def _add_status_parser(subparsers):
     subparsers.add_parser('status', help='Show system status')
 
-    # tasks
+
+def _add_tasks_parser(subparsers):
     tasks_p = subparsers.add_parser('tasks', help='List tasks')
     tasks_p.add_argument('--status', help='Filter by status')
-    tasks_p.add_argument('--search', '-s', help='Search in title/description')
+    tasks_p.add_argument('--search', '-s', action='append',
+                         help='Search in title/description (repeat to match any of several terms)')
 
-    # show
+
+def _add_show_parser(subparsers):
     show_p = subparsers.add_parser('show', help='Show task details')
     show_p.add_argument('task_id', help='Task ID')
 
-    # create
+
+def _add_create_parser(subparsers):
     create_p = subparsers.add_parser('create', help='Create a task')
     create_p.add_argument('title', nargs='?', default=None, help='Task title (optional with -i)')
     create_p.add_argument('--description', '-d', default='')
@@ -1636,17 +1903,20 @@ Examples:
     create_p.add_argument('--template', '-T', help='Create from template ID')
     create_p.add_argument('--interactive', '-i', action='store_true', help='Interactive wizard mode')
 
-    # next
+
+def _add_next_parser(subparsers):
     next_p = subparsers.add_parser('next', help='Claim next task')
     next_p.add_argument('--labels', '-l', nargs='*', default=[])
 
-    # complete
+
+def _add_complete_parser(subparsers):
     complete_p = subparsers.add_parser('complete', help='Complete one or more tasks')
     complete_p.add_argument('task_ids', nargs='+', metavar='task_id', help='Task ID(s) to complete')
     complete_p.add_argument('--note', '-n', default='')
     complete_p.add_argument('--force', '-f', action='store_true', help='Complete even if subtasks are incomplete')
 
-    # edit
+
+def _add_edit_parser(subparsers):
     edit_p = subparsers.add_parser('edit', help='Edit a task')
     edit_p.add_argument('task_id')
     edit_p.add_argument('--title', '-t', help='New title')
@@ -1654,17 +1924,20 @@ Examples:
     edit_p.add_argument('--priority', '-p', type=int, choices=[0, 1, 2, 3], help='New priority')
     edit_p.add_argument('--labels', '-l', nargs='*', help='New labels (replaces existing)')
 
-    # delete
+
+def _add_delete_parser(subparsers):
     delete_p = subparsers.add_parser('delete', help='Delete a task')
     delete_p.add_argument('task_id')
     delete_p.add_argument('--force', '-f', action='store_true', help='Delete even if task has subtasks')
 
-    # reopen
+
+def _add_reopen_parser(subparsers):
     reopen_p = subparsers.add_parser('reopen', help='Reopen one or more tasks')
     reopen_p.add_argument('task_ids', nargs='+', metavar='task_id', help='Task ID(s) to reopen')
     reopen_p.add_argument('--note', '-n', default='')
 
-    # archive
+
+def _add_archive_parser(subparsers):
     archive_p = subparsers.add_parser('archive', help='Archive old completed tasks')
     archive_sub = archive_p.add_subparsers(dest='archive_command')
 
@@ -1677,7 +1950,8 @@ Examples:
     archive_restore = archive_sub.add_parser('restore', help='Restore a task from archive')
     archive_restore.add_argument('task_id')
 
-    # time
+
+def _add_time_parser(subparsers):
     time_p = subparsers.add_parser('time', help='Time tracking')
     time_sub = time_p.add_subparsers(dest='time_command')
 
@@ -1697,7 +1971,8 @@ Examples:
     time_report.add_argument('--by', choices=['task', 'label', 'day'], default='task')
     time_report.add_argument('--labels', '-l', nargs='*', help='Filter by labels')
 
-    # template
+
+def _add_template_parser(subparsers):
     template_p = subparsers.add_parser('template', help='Manage task templates')
     template_sub = template_p.add_subparsers(dest='template_command')
 
@@ -1717,7 +1992,8 @@ Examples:
     template_show = template_sub.add_parser('show', help='Show template details')
     template_show.add_argument('template_id')
 
-    # subtask
+
+def _add_subtask_parser(subparsers):
     subtask_p = subparsers.add_parser('subtask', help='Manage subtasks')
     subtask_sub = subtask_p.add_subparsers(dest='subtask_command')
 
@@ -1734,32 +2010,34 @@ Examples:
     subtask_progress = subtask_sub.add_parser('progress', help='Show subtask progress')
     subtask_progress.add_argument('task_id', help='Parent task ID')
 
-    # start-parallel
+
+def _add_start_parallel_parser(subparsers):
     parallel_p = subparsers.add_parser('start-parallel', help='Start parallel mode')
     parallel_p.add_argument('--port', type=int, default=8765)
 
-    # stop-parallel
+
+def _add_stop_parallel_parser(subparsers):
     subparsers.add_parser('stop-parallel', help='Stop parallel mode')
 
-    # session
-    session_p = subparsers.add_parser('session', help='Manage sessions')
-    session_sub = session_p.add_subparsers(dest='session_command')
 
-    # session (no subcommand) - list sessions
-    session_p.add_argument('session_id', nargs='?', help='Session ID to show details')
+def _add_session_parser(subparsers):
+    # A nested subparser would swallow the positional session ID, so 'cleanup'
+    # is handled as a reserved session_id value by cmd_session instead.
+    session_p = subparsers.add_parser('session', help='Manage sessions')
+    session_p.add_argument('session_id', nargs='?',
+                           help="Session ID to show details, or 'cleanup' to remove stale sessions")
+    session_p.add_argument('--threshold', '-t', type=int, default=180,
+                           help='Stale threshold in seconds for cleanup (default: 180 = 3 minutes)')
 
-    # session cleanup
-    session_cleanup = session_sub.add_parser('cleanup', help='Remove stale sessions')
-    session_cleanup.add_argument('--threshold', '-t', type=int, default=180,
-                                  help='Stale threshold in seconds (default: 180 = 3 minutes)')
 
-    # dashboard
+def _add_dashboard_parser(subparsers):
     dashboard_p = subparsers.add_parser('dashboard', help='Launch dashboard')
     dashboard_p.add_argument('--refresh', type=float, default=3.0, help='Refresh interval in seconds')
     dashboard_p.add_argument('--once', action='store_true', help='Run once and exit')
     dashboard_p.add_argument('--no-alt-screen', action='store_true', help='Disable alternate screen buffer')
 
-    # docs - documentation generation
+
+def _add_docs_parser(subparsers):
     docs_p = subparsers.add_parser('docs', help='Generate documentation')
     docs_sub = docs_p.add_subparsers(dest='docs_command')
 
@@ -1788,80 +2066,131 @@ Examples:
     docs_all.add_argument('path', nargs='?', help='Project path')
     docs_all.add_argument('--output', '-o', help='Output directory')
 
-    args = parser.parse_args()
 
-    # Handle commands that don't need Agent
-    if args.command == 'init':
-        sys.exit(cmd_init(args))
-    elif args.command == 'uninstall':
-        sys.exit(cmd_uninstall(args))
-    elif args.command == 'update':
-        sys.exit(cmd_update(args))
-    elif args.command == 'dashboard':
-        from claudia import dashboard
-        dashboard.main(
-            state_dir=args.state_dir,
-            refresh=args.refresh,
-            once=args.once,
-            no_alt_screen=args.no_alt_screen,
-        )
-        sys.exit(0)
-    elif args.command == 'docs':
-        from claudia.docs import cmd_docs
-        sys.exit(cmd_docs(args))
-    elif args.command is None:
+# Insertion order is the order commands appear in --help
+SUBPARSER_BUILDERS = {
+    'init': _add_init_parser,
+    'uninstall': _add_uninstall_parser,
+    'update': _add_update_parser,
+    'status': _add_status_parser,
+    'tasks': _add_tasks_parser,
+    'show': _add_show_parser,
+    'create': _add_create_parser,
+    'next': _add_next_parser,
+    'complete': _add_complete_parser,
+    'edit': _add_edit_parser,
+    'delete': _add_delete_parser,
+    'reopen': _add_reopen_parser,
+    'archive': _add_archive_parser,
+    'time': _add_time_parser,
+    'template': _add_template_parser,
+    'subtask': _add_subtask_parser,
+    'start-parallel': _add_start_parallel_parser,
+    'stop-parallel': _add_stop_parallel_parser,
+    'session': _add_session_parser,
+    'dashboard': _add_dashboard_parser,
+    'docs': _add_docs_parser,
+}
+
+_EPILOG = '''
+Examples:
+  claudia init                    Initialize in current directory
+  claudia status                  Show system status
+  claudia create "Fix bug" -p 1   Create high-priority task
+  claudia next                    Claim next available task
+  claudia complete task-001       Complete a task
+  claudia update --check          Check for updates
+'''
+
+# Top-level options that consume the following argv token
+_GLOBAL_OPTS_WITH_VALUE = frozenset({'--state-dir'})
+
+
+def _find_command(argv: list) -> Optional[str]:
+    """Return the first positional token in argv (the command name), if any."""
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg in _GLOBAL_OPTS_WITH_VALUE:
+            skip_value = True
+        elif arg in ('-h', '--help'):
+            return None
+        elif not arg.startswith('-'):
+            return arg
+    return None
+
+
+def _print_traceback(verbose: bool):
+    """Print the active exception's traceback when --verbose is set."""
+    if verbose:
+        import traceback
+        traceback.print_exc()
+
+
+@functools.cache
+def _build_parser(command: Optional[str]):
+    """Build the top-level parser with the subparser(s) needed for command.
+
+    Only the named command's subparser is registered; None or an unknown
+    name registers all of them. Cached per command, since parse_args()
+    doesn't mutate the parser.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Claudia - Task coordination for Claude Code',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
+    )
+    parser.add_argument('--version', action='version', version=f'claudia {__version__}')
+    parser.add_argument('--state-dir', default='.agent-state')
+    parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--dry-run', action='store_true', help='Preview changes')
+
+    subparsers = parser.add_subparsers(dest='command')
+    build = SUBPARSER_BUILDERS.get(command)
+    if build:
+        build(subparsers)
+    else:
+        for build in SUBPARSER_BUILDERS.values():
+            build(subparsers)
+    return parser
+
+
+def main(argv: Optional[list] = None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Answer a bare --version without importing argparse or building the parser
+    if argv == ['--version']:
+        print(f'claudia {__version__}')
+        return 0
+
+    command = _find_command(argv)
+    parser = _build_parser(command if command in SUBPARSER_BUILDERS else None)
+    args = parser.parse_args(argv)
+
+    if args.command is None:
         parser.print_help()
         sys.exit(0)
 
+    # Handle commands that don't need Agent
+    standalone = STANDALONE_COMMANDS.get(args.command)
+    if standalone:
+        sys.exit(standalone(args))
+
     # Commands that need Agent
-    use_json = getattr(args, 'json', False)
-    verbose = getattr(args, 'verbose', False)
-    dry_run = getattr(args, 'dry_run', False)
+    use_json = args.json
+    verbose = args.verbose
+    dry_run = args.dry_run
 
     try:
-        agent = Agent(state_dir=args.state_dir)
+        from claudia.agent import Agent
 
-        if args.command == 'status':
-            cmd_status(args, agent, use_json)
-        elif args.command == 'tasks':
-            cmd_tasks(args, agent, use_json)
-        elif args.command == 'show':
-            cmd_show(args, agent, use_json)
-        elif args.command == 'create':
-            cmd_create(args, agent, use_json, dry_run)
-        elif args.command == 'next':
-            cmd_next(args, agent, use_json, dry_run)
-        elif args.command == 'complete':
-            cmd_complete(args, agent, use_json, dry_run)
-        elif args.command == 'edit':
-            cmd_edit(args, agent, use_json, dry_run)
-        elif args.command == 'delete':
-            cmd_delete(args, agent, use_json, dry_run)
-        elif args.command == 'reopen':
-            cmd_reopen(args, agent, use_json, dry_run)
-        elif args.command == 'archive':
-            cmd_archive(args, agent, use_json, dry_run)
-        elif args.command == 'time':
-            cmd_time(args, agent, use_json, dry_run)
-        elif args.command == 'template':
-            cmd_template(args, agent, use_json, dry_run)
-        elif args.command == 'subtask':
-            cmd_subtask(args, agent, use_json, dry_run)
-        elif args.command == 'session':
-            cmd_session(args, agent, use_json, dry_run)
-        elif args.command == 'start-parallel':
-            success = agent.start_parallel_mode(port=args.port)
-            if success:
-                print(f"✓ Parallel mode started on port {args.port}")
-                print("  Workers can connect by running 'claudia' in new terminals")
-            else:
-                print("✗ Failed to start parallel mode")
-        elif args.command == 'stop-parallel':
-            success = agent.stop_parallel_mode()
-            if success:
-                print("✓ Parallel mode stopped")
-            else:
-                print("✗ Could not stop parallel mode")
+        agent = Agent(state_dir=args.state_dir)
+        AGENT_COMMANDS[args.command](args, agent, use_json, dry_run)
 
     except KeyboardInterrupt:
         print("\nInterrupted")
@@ -1869,21 +2198,15 @@ Examples:
     except FileNotFoundError:
         print(f"✗ State directory not found: {args.state_dir}")
         print("  Run 'claudia init' to initialize")
-        if verbose:
-            import traceback
-            traceback.print_exc()
+        _print_traceback(verbose)
         sys.exit(1)
     except RuntimeError as e:
         print(f"✗ {e}")
-        if verbose:
-            import traceback
-            traceback.print_exc()
+        _print_traceback(verbose)
         sys.exit(1)
     except Exception as e:
         print(f"✗ Unexpected error: {e}")
-        if verbose:
-            import traceback
-            traceback.print_exc()
+        _print_traceback(verbose)
         sys.exit(1)
 
 
@@ -32,7 +32,11 @@ def _supports_color() -> bool:
     return True
 
 
-class Colors:
+# Whether color output is enabled, decided once at import
+COLORS_ENABLED = _supports_color()
+
+
+class _ColorsOn:
     """
     ANSI color codes - automatically disabled on unsupported terminals.
 
@@ -40,33 +44,44 @@ class Colors:
         from claudia.colors import Colors
         print(f"{Colors.GREEN}Success!{Colors.RESET}")
     """
-    _enabled = _supports_color()
+    _enabled = True
 
     # Reset
-    RESET = "\033[0m" if _enabled else ""
+    RESET = "\033[0m"
 
     # Styles
-    BOLD = "\033[1m" if _enabled else ""
-    DIM = "\033[2m" if _enabled else ""
-    UNDERLINE = "\033[4m" if _enabled else ""
+    BOLD = "\033[1m"
+    DIM = "\033[2m"
+    UNDERLINE = "\033[4m"
 
     # Colors
-    BLACK = "\033[30m" if _enabled else ""
-    RED = "\033[31m" if _enabled else ""
-    GREEN = "\033[32m" if _enabled else ""
-    YELLOW = "\033[33m" if _enabled else ""
-    BLUE = "\033[34m" if _enabled else ""
-    MAGENTA = "\033[35m" if _enabled else ""
-    CYAN = "\033[36m" if _enabled else ""
-    WHITE = "\033[37m" if _enabled else ""
+    BLACK = "\033[30m"
+    RED = "\033[31m"
+    GREEN = "\033[32m"
+    YELLOW = "\033[33m"
+    BLUE = "\033[34m"
+    MAGENTA = "\033[35m"
+    CYAN = "\033[36m"
+    WHITE = "\033[37m"
 
     # Bright colors
-    BRIGHT_RED = "\033[91m" if _enabled else ""
-    BRIGHT_GREEN = "\033[92m" if _enabled else ""
-    BRIGHT_YELLOW = "\033[93m" if _enabled else ""
-    BRIGHT_BLUE = "\033[94m" if _enabled else ""
-    BRIGHT_MAGENTA = "\033[95m" if _enabled else ""
-    BRIGHT_CYAN = "\033[96m" if _enabled else ""
+    BRIGHT_RED = "\033[91m"
+    BRIGHT_GREEN = "\033[92m"
+    BRIGHT_YELLOW = "\033[93m"
+    BRIGHT_BLUE = "\033[94m"
+    BRIGHT_MAGENTA = "\033[95m"
+    BRIGHT_CYAN = "\033[96m"
+
+    # Lookup tables for the helpers below, indexed by priority or keyed by status
+    _PRIORITY_COLORS = (RED, YELLOW, RESET, DIM)  # Critical, High, Medium, Low
+    _PRIORITY_LABELS = (f"{RED}P0{RESET}", f"{YELLOW}P1{RESET}", f"{RESET}P2{RESET}", f"{DIM}P3{RESET}")
+    _STATUS_COLORS = {'open': CYAN, 'in_progress': YELLOW, 'done': GREEN, 'blocked': RED}
+    _STATUS_LABELS = {
+        'open': f"{CYAN}open{RESET}",
+        'in_progress': f"{YELLOW}in_progress{RESET}",
+        'done': f"{GREEN}done{RESET}",
+        'blocked': f"{RED}blocked{RESET}",
+    }
 
     @classmethod
     def is_enabled(cls) -> bool:
@@ -76,38 +91,47 @@ class Colors:
     @classmethod
     def priority_color(cls, priority: int) -> str:
         """Get color for a priority level."""
-        colors = {
-            0: cls.RED,       # Critical
-            1: cls.YELLOW,    # High
-            2: cls.RESET,     # Medium (default)
-            3: cls.DIM,       # Low
-        }
-        return colors.get(priority, cls.RESET)
+        if isinstance(priority, int) and 0 <= priority <= 3:
+            return cls._PRIORITY_COLORS[priority]
+        return cls.RESET
 
     @classmethod
     def status_color(cls, status: str) -> str:
         """Get color for a status."""
-        colors = {
-            'open': cls.CYAN,
-            'in_progress': cls.YELLOW,
-            'done': cls.GREEN,
-            'blocked': cls.RED,
-        }
-        return colors.get(status, cls.RESET)
+        return cls._STATUS_COLORS.get(status, cls.RESET)
 
     @classmethod
     def format_priority(cls, priority: int) -> str:
         """Format a priority with color."""
-        labels = {0: "P0", 1: "P1", 2: "P2", 3: "P3"}
-        color = cls.priority_color(priority)
-        label = labels.get(priority, "P?")
-        return f"{color}{label}{cls.RESET}"
+        if isinstance(priority, int) and 0 <= priority <= 3:
+            return cls._PRIORITY_LABELS[priority]
+        return f"{cls.RESET}P?{cls.RESET}"
 
     @classmethod
     def format_status(cls, status: str) -> str:
         """Format a status with color."""
-        color = cls.status_color(status)
-        return f"{color}{status}{cls.RESET}"
+        label = cls._STATUS_LABELS.get(status)
+        if label is None:
+            return f"{cls.RESET}{status}{cls.RESET}"
+        return label
+
+
+class _ColorsOff(_ColorsOn):
+    """Color codes as empty strings, for terminals without color."""
+    _enabled = False
+
+    RESET = BOLD = DIM = UNDERLINE = ""
+    BLACK = RED = GREEN = YELLOW = BLUE = MAGENTA = CYAN = WHITE = ""
+    BRIGHT_RED = BRIGHT_GREEN = BRIGHT_YELLOW = ""
+    BRIGHT_BLUE = BRIGHT_MAGENTA = BRIGHT_CYAN = ""
+
+    _PRIORITY_COLORS = ("", "", "", "")
+    _PRIORITY_LABELS = ("P0", "P1", "P2", "P3")
+    _STATUS_COLORS = {}
+    _STATUS_LABELS = {}
+
+
+Colors = _ColorsOn if COLORS_ENABLED else _ColorsOff
 
 
 # Convenience functions
@@ -123,6 +147,6 @@ def status_str(s: str) -> str:
 
 def colorize(text: str, color: str) -> str:
     """Apply a color to text if colors are enabled."""
-    if Colors._enabled:
+    if COLORS_ENABLED:
         return f"{color}{text}{Colors.RESET}"
     return text
@@ -24,13 +24,24 @@ import asyncio
 import json
 import logging
 import os
-from dataclasses import dataclass, field, asdict
+import signal
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import partial
+from itertools import islice
 from pathlib import Path
 from typing import Optional
+from urllib.parse import parse_qs, urlsplit
 import argparse
 
+try:
+    from claudia.agent import replay_journal
+except ImportError:
+    from agent import replay_journal  # Run as a script from the package directory
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(message)s',
@@ -38,6 +49,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Optional fast JSON backend (pip install 'claudia[fast]') for HTTP bodies,
+# journal lines and parsing. Snapshots are still written with stdlib json so
+# tasks.json formatting doesn't depend on what's installed.
+try:
+    import orjson
+
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+    _json_loads = json.loads
+
 
 # ============================================================================
 # Data Models
@@ -46,6 +73,22 @@ logger = logging.getLogger(__name__)
 # Maximum number of notes to keep per task (prevents unbounded growth)
 MAX_NOTES_PER_TASK = 50
 
+# Last formatted timestamp and the millisecond it was made for
+_now_iso_cache = [0, '']
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time as an ISO string at millisecond precision, so it can be
+    formatted at most once per millisecond.
+    """
+    ms = int(time.time() * 1000)
+    if ms != _now_iso_cache[0]:
+        _now_iso_cache[0] = ms
+        _now_iso_cache[1] = datetime.fromtimestamp(
+            ms / 1000, timezone.utc).isoformat(timespec='milliseconds') + 'Z'
+    return _now_iso_cache[1]
+
 
 class TaskStatus(str, Enum):
     OPEN = "open"
@@ -54,8 +97,9 @@ class TaskStatus(str, Enum):
     BLOCKED = "blocked"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
+    # status is always a TaskStatus member; from_dict() normalizes stored strings
     id: str
     title: str
     description: str = ""
@@ -65,23 +109,37 @@ class Task:
     assignee: Optional[str] = None
     labels: list[str] = field(default_factory=list)
     branch: Optional[str] = None  # Git branch for this task's work
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat() + 'Z')
-    updated_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat() + 'Z')
-    notes: list[dict] = field(default_factory=list)
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
+    # Bounded: appends past the limit drop the oldest note
+    notes: deque[dict] = field(default_factory=partial(deque, maxlen=MAX_NOTES_PER_TASK))
     # v2 fields for subtasks and time tracking
     parent_id: Optional[str] = None  # ID of parent task (for subtasks)
     subtasks: list[str] = field(default_factory=list)  # List of subtask IDs
     is_subtask: bool = False  # Quick filter flag
     time_tracking: Optional[dict] = None  # Timer data: {started_at, paused_at, total_seconds}
+    # Serialized form reused by snapshots and the journal until mark_modified()
+    # drops it. Code that changes a field must call mark_modified() (mutations
+    # do so through CoordinatorState.append_event), or snapshots write stale data.
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def mark_modified(self):
+        """Invalidate the cached dict; required after changing any field."""
+        self._cached_dict = None
 
     def to_dict(self) -> dict:
-        # Truncate notes to prevent unbounded growth (keep most recent)
-        truncated_notes = self.notes[-MAX_NOTES_PER_TASK:] if len(self.notes) > MAX_NOTES_PER_TASK else self.notes
-        return {
+        """Serialized task for callers; a copy, so editing it can't touch the cache."""
+        return dict(self._snapshot_dict())
+
+    def _snapshot_dict(self) -> dict:
+        """Cached serialized task for snapshot/journal encoding; never hand it out."""
+        if self._cached_dict is not None:
+            return self._cached_dict
+        self._cached_dict = {
             'id': self.id,
             'title': self.title,
             'description': self.description,
-            'status': self.status.value if isinstance(self.status, TaskStatus) else self.status,
+            'status': self.status.value,
             'priority': self.priority,
             'blocked_by': self.blocked_by,
             'assignee': self.assignee,
@@ -89,67 +147,98 @@ class Task:
             'branch': self.branch,
             'created_at': self.created_at,
             'updated_at': self.updated_at,
-            'notes': truncated_notes,
+            'notes': list(self.notes),
             # v2 fields
             'parent_id': self.parent_id,
             'subtasks': self.subtasks,
             'is_subtask': self.is_subtask,
             'time_tracking': self.time_tracking,
         }
+        return self._cached_dict
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Task':
-        status = data.get('status', 'open')
-        if isinstance(status, str):
-            try:
-                status = TaskStatus(status)
-            except ValueError:
-                status = TaskStatus.OPEN
+        g = data.get  # Called once per field for every task on load
+        try:
+            status = TaskStatus(g('status', 'open'))
+        except ValueError:
+            status = TaskStatus.OPEN
         return cls(
             id=data['id'],
             title=data['title'],
-            description=data.get('description', ''),
+            description=g('description', ''),
             status=status,
-            priority=data.get('priority', 2),
-            blocked_by=data.get('blocked_by', []),
-            assignee=data.get('assignee'),
-            labels=data.get('labels', []),
-            branch=data.get('branch'),
-            created_at=data.get('created_at', datetime.now(timezone.utc).isoformat() + 'Z'),
-            updated_at=data.get('updated_at', datetime.now(timezone.utc).isoformat() + 'Z'),
-            notes=data.get('notes', []),
+            priority=g('priority', 2),
+            blocked_by=g('blocked_by', []),
+            assignee=g('assignee'),
+            labels=g('labels', []),
+            branch=g('branch'),
+            # Only stamp "now" for tasks that lack a timestamp
+            created_at=g('created_at') or _now_iso(),
+            updated_at=g('updated_at') or _now_iso(),
+            notes=deque(g('notes', ()), maxlen=MAX_NOTES_PER_TASK),
             # v2 fields with defaults for backward compatibility
-            parent_id=data.get('parent_id'),
-            subtasks=data.get('subtasks', []),
-            is_subtask=data.get('is_subtask', False),
-            time_tracking=data.get('time_tracking'),
+            parent_id=g('parent_id'),
+            subtasks=g('subtasks', []),
+            is_subtask=g('is_subtask', False),
+            time_tracking=g('time_tracking'),
         )
 
 
-@dataclass 
+@dataclass(slots=True)
 class Session:
     session_id: str
     role: str = "worker"  # "main" or "worker"
-    started_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat() + 'Z')
-    last_heartbeat: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat() + 'Z')
+    started_at: str = field(default_factory=_now_iso)
+    last_heartbeat: str = field(default_factory=_now_iso)
     working_on: list[str] = field(default_factory=list)
     status: str = "active"
     context: str = ""
     labels: list[str] = field(default_factory=list)
     branch: Optional[str] = None  # Current git branch
+    # time.monotonic() of the last heartbeat, for stale checks without parsing
+    # last_heartbeat; in-memory only, not part of to_dict()
+    last_heartbeat_ts: float = field(default_factory=time.monotonic, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            'session_id': self.session_id,
+            'role': self.role,
+            'started_at': self.started_at,
+            'last_heartbeat': self.last_heartbeat,
+            'working_on': list(self.working_on),
+            'status': self.status,
+            'context': self.context,
+            'labels': list(self.labels),
+            'branch': self.branch,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Session':
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        fields = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in data.items() if k in fields and fields[k].init})
 
 
 # ============================================================================
 # Coordinator State
 # ============================================================================
 
+def _fsync_dir(path: Path):
+    """Flush a directory entry (e.g. after a rename) to disk; no-op where unsupported."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # Windows can't open directories for fsync
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Some filesystems reject fsync on directories (EINVAL)
+    finally:
+        os.close(fd)
+
+
 class CoordinatorState:
     def __init__(self, state_file: Path):
         self.state_file = state_file
@@ -157,6 +246,23 @@ class CoordinatorState:
         self.sessions: dict[str, Session] = {}
         self.next_id: int = 1
         self.version: int = 1
+        # Task mutations between snapshots are appended here as JSON lines.
+        # Each snapshot bumps journal_gen, so lines from before it are ignored
+        # if a crash leaves the old journal behind.
+        self.journal_file = state_file.with_suffix('.jsonl')
+        self.journal_gen: int = 0
+        # Ready index: open, unassigned tasks whose blockers are all done,
+        # plus reverse blocker edges so completing a task re-checks only its
+        # dependents. Kept current via reindex()/unindex() under the lock.
+        # ready_ids is a dict used as an ordered set, so ties between equally
+        # scored tasks resolve the same way on every run.
+        self.ready_ids: dict[str, None] = {}
+        self._dependents: dict[str, set[str]] = {}
+        # Done tasks, in the same ordered-set form, so /status and the merge
+        # summary don't rescan every task ever created
+        self.done_ids: dict[str, None] = {}
+        # Set by journaled mutations, cleared by save(); periodic_save waits on it
+        self._dirty = asyncio.Event()
         self._lock = asyncio.Lock()
         self._subscribers: list[asyncio.Queue] = []
 
@@ -201,38 +307,152 @@ class CoordinatorState:
         # First check for orphaned tmp files from crash recovery
         self._recover_tmp_file()
 
-        with open(self.state_file) as f:
-            return json.load(f)
+        if self.state_file.exists():
+            with open(self.state_file, 'rb') as f:
+                data = _json_loads(f.read())
+        else:
+            data = {}  # Never snapshotted; everything is in the journal
+        self._replay_journal_sync(data)
+        return data
+
+    def _replay_journal_sync(self, data: dict) -> int:
+        """Apply journaled task updates newer than the snapshot to data. Returns count applied."""
+        applied = replay_journal(data, self.journal_file, _json_loads)
+        if applied:
+            logger.warning(f"Replayed {applied} journal entries from {self.journal_file}")
+        return applied
 
     def _save_sync(self, data: dict):
         """Synchronous file save - run in thread pool to avoid blocking event loop."""
         tmp_file = self.state_file.with_suffix('.tmp')
-        with open(tmp_file, 'w') as f:
-            json.dump(data, f, indent=2)
-        tmp_file.rename(self.state_file)
+        # Encode once and hand the file a single buffer, rather than
+        # json.dump()'s write per encoder chunk. Same indent=2 layout that
+        # single mode's Agent._save_tasks writes.
+        payload = json.dumps(data, indent=2).encode()
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+            # Make the data durable before the rename can expose it
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.state_file)
+        _fsync_dir(self.state_file.parent)
+        # The snapshot now covers everything journaled so far. A leftover
+        # journal is harmless (its lines carry the old generation), so don't
+        # fail a save whose snapshot already landed.
+        try:
+            self.journal_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not remove journal {self.journal_file}: {e}")
+
+    def _append_journal_sync(self, line: bytes):
+        """Synchronous journal append - run in thread pool to avoid blocking event loop."""
+        with open(self.journal_file, 'ab') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
 
     async def load(self):
-        if self.state_file.exists():
+        if self.state_file.exists() or self.journal_file.exists():
             async with self._lock:
                 # Run file I/O in thread pool to avoid blocking event loop
                 data = await asyncio.to_thread(self._load_sync)
                 self.version = data.get('version', 1)
                 self.next_id = data.get('next_id', 1)
+                self.journal_gen = data.get('journal_gen', 0)
                 self.tasks = {
                     t['id']: Task.from_dict(t)
                     for t in data.get('tasks', [])
                 }
+                self.rebuild_index()
             logger.info(f"Loaded {len(self.tasks)} tasks from {self.state_file}")
+            if self.journal_file.exists():
+                # Fold any replayed entries into a fresh snapshot
+                await self.save()
 
     async def save(self):
         async with self._lock:
+            self._dirty.clear()
+            gen = self.journal_gen + 1
             data = {
                 'version': self.version,
                 'next_id': self.next_id,
-                'tasks': [t.to_dict() for t in self.tasks.values()],
+                'journal_gen': gen,
+                'tasks': [t._snapshot_dict() for t in self.tasks.values()],
             }
             # Run file I/O in thread pool to avoid blocking event loop
             await asyncio.to_thread(self._save_sync, data)
+            # Only now is gen on disk; if the write failed, later appends must
+            # keep the old generation so replay still applies them
+            self.journal_gen = gen
+
+    async def append_event(self, tasks: list[Task], deleted: list[str] = ()):
+        """
+        Journal the current state of changed tasks (and ids of deleted ones)
+        instead of rewriting the snapshot.
+
+        Every task mutation goes through here, so this is also where cached
+        task dicts are invalidated; untouched tasks keep theirs for save().
+        Must be called with self._lock held, so appends can't interleave with save().
+        """
+        for t in tasks:
+            t.mark_modified()
+        event = {
+            'gen': self.journal_gen,
+            'next_id': self.next_id,
+            'tasks': [t._snapshot_dict() for t in tasks],
+        }
+        if deleted:
+            event['deleted'] = list(deleted)
+        line = _json_dumps(event) + b'\n'
+        await asyncio.to_thread(self._append_journal_sync, line)
+        self._dirty.set()
+
+    def is_ready(self, task: Task) -> bool:
+        """Check if a task can be claimed (open, unassigned, no open blockers)."""
+        if task.status != TaskStatus.OPEN or task.assignee is not None:
+            return False
+        for blocker_id in task.blocked_by:
+            blocker = self.tasks.get(blocker_id)
+            if blocker and blocker.status != TaskStatus.DONE:
+                return False
+        return True
+
+    def _update_ready(self, task: Task):
+        if self.is_ready(task):
+            self.ready_ids[task.id] = None
+        else:
+            self.ready_ids.pop(task.id, None)
+
+    def reindex(self, *tasks: Task):
+        """Refresh the ready/done indexes after tasks were added or changed status/assignee."""
+        for task in tasks:
+            for blocker_id in task.blocked_by:
+                self._dependents.setdefault(blocker_id, set()).add(task.id)
+            self._update_ready(task)
+            if task.status == TaskStatus.DONE:
+                self.done_ids[task.id] = None
+            else:
+                self.done_ids.pop(task.id, None)
+            for dep_id in self._dependents.get(task.id, ()):
+                dep = self.tasks.get(dep_id)
+                if dep:
+                    self._update_ready(dep)
+
+    def unindex(self, task_id: str):
+        """Drop a deleted task from the indexes; its dependents lose a blocker."""
+        self.ready_ids.pop(task_id, None)
+        self.done_ids.pop(task_id, None)
+        for dep_id in self._dependents.pop(task_id, ()):
+            dep = self.tasks.get(dep_id)
+            if dep:
+                self._update_ready(dep)
+
+    def rebuild_index(self):
+        """Build the indexes from scratch (after load)."""
+        self.ready_ids = {}
+        self._dependents = {}
+        self.done_ids = {}
+        self.reindex(*self.tasks.values())
 
     def subscribe(self) -> asyncio.Queue:
         queue = asyncio.Queue(maxsize=100)  # Limit queue size to prevent memory bloat
@@ -244,7 +464,10 @@ class CoordinatorState:
             self._subscribers.remove(queue)
 
     async def broadcast(self, event: dict):
-        event['timestamp'] = datetime.now(timezone.utc).isoformat() + 'Z'
+        if not self._subscribers:
+            return
+        # Stamp a copy; every subscriber gets the same dict, the caller's is untouched
+        event = {**event, 'timestamp': _now_iso()}
         dead_queues = []
         for queue in self._subscribers:
             try:
@@ -302,7 +525,9 @@ class Coordinator:
         async with self.state._lock:
             if session_id not in self.state.sessions:
                 return False
-            self.state.sessions[session_id].last_heartbeat = datetime.now(timezone.utc).isoformat() + 'Z'
+            session = self.state.sessions[session_id]
+            session.last_heartbeat = _now_iso()
+            session.last_heartbeat_ts = time.monotonic()
         return True
 
     async def end_session(self, session_id: str, release_tasks: bool = True):
@@ -313,25 +538,29 @@ class Coordinator:
             session = self.state.sessions[session_id]
             was_worker = session.role == "worker"
 
+            released = []
             if release_tasks:
                 for task in self.state.tasks.values():
                     if task.assignee == session_id:
+                        released.append(task)
                         task.assignee = None
                         task.status = TaskStatus.OPEN
-                        task.updated_at = datetime.now(timezone.utc).isoformat() + 'Z'
+                        task.updated_at = _now_iso()
                         task.notes.append({
-                            'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                            'timestamp': _now_iso(),
                             'session_id': session_id,
                             'note': 'Released on session end',
                         })
 
             del self.state.sessions[session_id]
+            if released:
+                self.state.reindex(*released)
+                await self.state.append_event(released)
 
         await self.state.broadcast({
             'event': 'session_ended',
             'session_id': session_id,
         })
-        await self.state.save()
         logger.info(f"Session {session_id} ended")
 
         # Check if we should auto-shutdown (only main session left)
@@ -350,14 +579,13 @@ class Coordinator:
                 })
 
     async def cleanup_stale_sessions(self) -> list[str]:
-        now = datetime.now(timezone.utc)
-        stale_ids = []
+        cutoff = time.monotonic() - self.stale_threshold.total_seconds()
 
         async with self.state._lock:
-            for session_id, session in list(self.state.sessions.items()):
-                last_hb = datetime.fromisoformat(session.last_heartbeat.replace('Z', ''))
-                if now - last_hb > self.stale_threshold:
-                    stale_ids.append(session_id)
+            stale_ids = [
+                session_id for session_id, session in self.state.sessions.items()
+                if session.last_heartbeat_ts < cutoff
+            ]
 
         for session_id in stale_ids:
             logger.warning(f"Cleaning up stale session: {session_id}")
@@ -391,19 +619,20 @@ class Coordinator:
 
             if session_id:
                 task.notes.append({
-                    'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                    'timestamp': _now_iso(),
                     'session_id': session_id,
                     'note': 'Created task',
                 })
 
             self.state.tasks[task_id] = task
+            self.state.reindex(task)
+            await self.state.append_event([task])
 
         await self.state.broadcast({
             'event': 'task_created',
             'task_id': task_id,
             'title': title,
         })
-        await self.state.save()
         logger.info(f"Task {task_id} created: {title}")
         return task
 
@@ -421,9 +650,9 @@ class Coordinator:
         if not session:
             return affinity
 
-        # Bonus for label match with session preferences
-        if session.preferred_labels and task.labels:
-            matching = set(task.labels) & set(session.preferred_labels)
+        # Bonus for label match with the labels the session registered with
+        if session.labels and task.labels:
+            matching = set(task.labels) & set(session.labels)
             affinity += len(matching) * 2.0
 
         # Bonus for completing similar tasks before (from history)
@@ -461,23 +690,8 @@ class Coordinator:
         - Load balancing (prefer less busy sessions)
         """
         async with self.state._lock:
-            ready_tasks = []
-            for task in self.state.tasks.values():
-                if task.status != TaskStatus.OPEN:
-                    continue
-                if task.assignee is not None:
-                    continue
-
-                blocked = False
-                for blocker_id in task.blocked_by:
-                    blocker = self.state.tasks.get(blocker_id)
-                    if blocker and blocker.status != TaskStatus.DONE:
-                        blocked = True
-                        break
-                if blocked:
-                    continue
-
-                ready_tasks.append(task)
+            tasks = self.state.tasks
+            ready_tasks = [tasks[tid] for tid in self.state.ready_ids]
 
             if not ready_tasks:
                 return None
@@ -504,28 +718,29 @@ class Coordinator:
 
                 return (priority_score, label_score, affinity_score, load_penalty, task.created_at)
 
-            ready_tasks.sort(key=score_task)
-            best_task = ready_tasks[0]
+            best_task = min(ready_tasks, key=score_task)
 
             # Claim it
             best_task.assignee = session_id
             best_task.status = TaskStatus.IN_PROGRESS
-            best_task.updated_at = datetime.now(timezone.utc).isoformat() + 'Z'
+            best_task.updated_at = _now_iso()
             best_task.notes.append({
-                'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                'timestamp': _now_iso(),
                 'session_id': session_id,
                 'note': 'Claimed task',
             })
 
+            self.state.reindex(best_task)
+
             if session_id in self.state.sessions:
                 self.state.sessions[session_id].working_on.append(best_task.id)
+            await self.state.append_event([best_task])
 
         await self.state.broadcast({
             'event': 'task_claimed',
             'task_id': best_task.id,
             'session_id': session_id,
         })
-        await self.state.save()
         logger.info(f"Task {best_task.id} claimed by {session_id}")
         return best_task
 
@@ -555,7 +770,7 @@ class Coordinator:
                 for sid in task.subtasks:
                     subtask = self.state.tasks.get(sid)
                     if subtask and subtask.status != TaskStatus.DONE:
-                        status_val = subtask.status.value if isinstance(subtask.status, TaskStatus) else subtask.status
+                        status_val = subtask.status.value
                         incomplete.append({
                             'id': sid,
                             'title': subtask.title,
@@ -572,13 +787,13 @@ class Coordinator:
 
             task.status = TaskStatus.DONE
             task.assignee = None
-            task.updated_at = datetime.now(timezone.utc).isoformat() + 'Z'
+            task.updated_at = _now_iso()
             if branch:
                 task.branch = branch
 
             if completion_note:
                 task.notes.append({
-                    'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                    'timestamp': _now_iso(),
                     'session_id': session_id,
                     'note': f'Completed: {completion_note}',
                 })
@@ -588,13 +803,15 @@ class Coordinator:
                 if task_id in session.working_on:
                     session.working_on.remove(task_id)
 
+            self.state.reindex(task)
+            await self.state.append_event([task])
+
         await self.state.broadcast({
             'event': 'task_completed',
             'task_id': task_id,
             'session_id': session_id,
             'branch': branch,
         })
-        await self.state.save()
         logger.info(f"Task {task_id} completed by {session_id}")
         return {'success': True, 'task': task.to_dict()}
 
@@ -604,13 +821,13 @@ class Coordinator:
                 return False
             task = self.state.tasks[task_id]
             task.notes.append({
-                'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                'timestamp': _now_iso(),
                 'session_id': session_id,
                 'note': note,
             })
-            task.updated_at = datetime.now(timezone.utc).isoformat() + 'Z'
+            task.updated_at = _now_iso()
+            await self.state.append_event([task])
 
-        await self.state.save()
         return True
 
     async def reopen_task(
@@ -625,26 +842,27 @@ class Coordinator:
                 return None
 
             task = self.state.tasks[task_id]
-            old_status = task.status.value if isinstance(task.status, TaskStatus) else task.status
+            old_status = task.status.value
             task.status = TaskStatus.OPEN
             task.assignee = None
-            task.updated_at = datetime.now(timezone.utc).isoformat() + 'Z'
+            task.updated_at = _now_iso()
 
             note_text = f'Reopened (was {old_status})'
             if note:
                 note_text += f': {note}'
             task.notes.append({
-                'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                'timestamp': _now_iso(),
                 'session_id': session_id,
                 'note': note_text,
             })
+            self.state.reindex(task)
+            await self.state.append_event([task])
 
         await self.state.broadcast({
             'event': 'task_reopened',
             'task_id': task_id,
             'session_id': session_id,
         })
-        await self.state.save()
         logger.info(f"Task {task_id} reopened by {session_id}")
         return task
 
@@ -679,7 +897,7 @@ class Coordinator:
                     for sid in task.subtasks:
                         subtask = self.state.tasks.get(sid)
                         if subtask and subtask.status != TaskStatus.DONE:
-                            status_val = subtask.status.value if isinstance(subtask.status, TaskStatus) else subtask.status
+                            status_val = subtask.status.value
                             incomplete.append({
                                 'id': sid,
                                 'title': subtask.title,
@@ -696,19 +914,19 @@ class Coordinator:
 
                 task.status = TaskStatus.DONE
                 task.assignee = None
-                task.updated_at = datetime.now(timezone.utc).isoformat() + 'Z'
+                task.updated_at = _now_iso()
                 if branch:
                     task.branch = branch
 
                 if completion_note:
                     task.notes.append({
-                        'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                        'timestamp': _now_iso(),
                         'session_id': session_id,
                         'note': f'Completed: {completion_note}',
                     })
                 else:
                     task.notes.append({
-                        'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                        'timestamp': _now_iso(),
                         'session_id': session_id,
                         'note': 'Completed (bulk)',
                     })
@@ -718,8 +936,13 @@ class Coordinator:
                     if task_id in session.working_on:
                         session.working_on.remove(task_id)
 
+                self.state.reindex(task)
                 succeeded.append(task_id)
 
+            if succeeded:
+                # One journal line (and fsync) for the whole batch
+                await self.state.append_event([self.state.tasks[tid] for tid in succeeded])
+
         if succeeded:
             await self.state.broadcast({
                 'event': 'tasks_bulk_completed',
@@ -727,7 +950,6 @@ class Coordinator:
                 'session_id': session_id,
                 'count': len(succeeded),
             })
-            await self.state.save()
             logger.info(f"{len(succeeded)} task(s) bulk completed by {session_id}")
 
         return {
@@ -759,7 +981,7 @@ class Coordinator:
                     continue
 
                 task = self.state.tasks[task_id]
-                old_status = task.status.value if isinstance(task.status, TaskStatus) else task.status
+                old_status = task.status.value
 
                 if old_status == 'open':
                     failed.append({'id': task_id, 'error': 'Task is already open'})
@@ -767,19 +989,24 @@ class Coordinator:
 
                 task.status = TaskStatus.OPEN
                 task.assignee = None
-                task.updated_at = datetime.now(timezone.utc).isoformat() + 'Z'
+                task.updated_at = _now_iso()
 
                 note_text = f'Reopened (was {old_status})'
                 if note:
                     note_text += f': {note}'
                 task.notes.append({
-                    'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                    'timestamp': _now_iso(),
                     'session_id': session_id,
                     'note': note_text,
                 })
 
+                self.state.reindex(task)
                 succeeded.append(task_id)
 
+            if succeeded:
+                # One journal line (and fsync) for the whole batch
+                await self.state.append_event([self.state.tasks[tid] for tid in succeeded])
+
         if succeeded:
             await self.state.broadcast({
                 'event': 'tasks_bulk_reopened',
@@ -787,7 +1014,6 @@ class Coordinator:
                 'session_id': session_id,
                 'count': len(succeeded),
             })
-            await self.state.save()
             logger.info(f"{len(succeeded)} task(s) bulk reopened by {session_id}")
 
         return {
@@ -830,16 +1056,18 @@ class Coordinator:
 
             if session_id:
                 subtask.notes.append({
-                    'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                    'timestamp': _now_iso(),
                     'session_id': session_id,
                     'note': f'Created as subtask of {parent_id}',
                 })
 
             # Add to parent's subtask list
             parent.subtasks.append(task_id)
-            parent.updated_at = datetime.now(timezone.utc).isoformat() + 'Z'
+            parent.updated_at = _now_iso()
 
             self.state.tasks[task_id] = subtask
+            self.state.reindex(subtask)
+            await self.state.append_event([subtask, parent])
 
         await self.state.broadcast({
             'event': 'subtask_created',
@@ -847,7 +1075,6 @@ class Coordinator:
             'parent_id': parent_id,
             'title': title,
         })
-        await self.state.save()
         logger.info(f"Subtask {task_id} created under {parent_id}: {title}")
         return subtask
 
@@ -874,7 +1101,7 @@ class Coordinator:
             for sid in subtask_ids:
                 subtask = self.state.tasks.get(sid)
                 if subtask:
-                    status = subtask.status.value if isinstance(subtask.status, TaskStatus) else subtask.status
+                    status = subtask.status.value
                     counts[status] = counts.get(status, 0) + 1
 
             total = len(subtask_ids)
@@ -938,12 +1165,13 @@ class Coordinator:
                 changes.append("labels")
 
             if changes:
-                task.updated_at = datetime.now(timezone.utc).isoformat() + 'Z'
+                task.updated_at = _now_iso()
                 task.notes.append({
-                    'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+                    'timestamp': _now_iso(),
                     'session_id': session_id,
                     'note': f'Edited: {", ".join(changes)}',
                 })
+                await self.state.append_event([task])
 
         if changes:
             await self.state.broadcast({
@@ -952,7 +1180,6 @@ class Coordinator:
                 'session_id': session_id,
                 'changes': changes,
             })
-            await self.state.save()
             logger.info(f"Task {task_id} edited by {session_id}: {', '.join(changes)}")
 
         return task
@@ -980,123 +1207,113 @@ class Coordinator:
                 }
 
             deleted_subtasks = []
+            changed = []
 
             # Remove from parent's subtask list if this is a subtask
             if task.parent_id and task.parent_id in self.state.tasks:
                 parent = self.state.tasks[task.parent_id]
                 if task_id in parent.subtasks:
                     parent.subtasks.remove(task_id)
-                    parent.updated_at = datetime.now(timezone.utc).isoformat() + 'Z'
+                    parent.updated_at = _now_iso()
+                    changed.append(parent)
 
             # Delete subtasks if force
             if task.subtasks and force:
                 for sid in task.subtasks:
                     if sid in self.state.tasks:
                         del self.state.tasks[sid]
+                        self.state.unindex(sid)
                         deleted_subtasks.append(sid)
 
             # Delete the task
             del self.state.tasks[task_id]
+            self.state.unindex(task_id)
+            await self.state.append_event(changed, deleted=[task_id, *deleted_subtasks])
 
         await self.state.broadcast({
             'event': 'task_deleted',
             'task_id': task_id,
             'session_id': session_id,
         })
-        await self.state.save()
         logger.info(f"Task {task_id} deleted by {session_id}")
 
         return {'success': True, 'deleted_subtasks': deleted_subtasks}
 
     async def get_status(self) -> dict:
+        # Only the snapshot happens under the lock; counting and formatting
+        # run after it is released so mutators aren't held up by readers
         async with self.state._lock:
-            tasks_by_status = {}
-            for task in self.state.tasks.values():
-                status = task.status.value if isinstance(task.status, TaskStatus) else task.status
-                tasks_by_status[status] = tasks_by_status.get(status, 0) + 1
-
-            ready_count = 0
-            for task in self.state.tasks.values():
-                if task.status != TaskStatus.OPEN or task.assignee is not None:
-                    continue
-                blocked = False
-                for blocker_id in task.blocked_by:
-                    blocker = self.state.tasks.get(blocker_id)
-                    if blocker and blocker.status != TaskStatus.DONE:
-                        blocked = True
-                        break
-                if not blocked:
-                    ready_count += 1
-
-            # Separate main and worker sessions
-            main_session = None
-            worker_sessions = {}
-            for sid, s in self.state.sessions.items():
-                if s.role == "main":
-                    main_session = {
-                        'session_id': sid,
-                        'working_on': s.working_on,
-                        'context': s.context,
-                        'last_heartbeat': s.last_heartbeat,
-                    }
-                else:
-                    worker_sessions[sid] = {
-                        'working_on': s.working_on,
-                        'context': s.context,
-                        'labels': s.labels,
-                        'branch': s.branch,
-                        'last_heartbeat': s.last_heartbeat,
-                    }
-
-            # Get completed tasks with branches (for merge summary)
-            completed_with_branches = [
-                {'id': t.id, 'title': t.title, 'branch': t.branch}
-                for t in self.state.tasks.values()
-                if t.status == TaskStatus.DONE and t.branch
-            ]
+            tasks = list(self.state.tasks.values())
+            completed = [self.state.tasks[tid] for tid in self.state.done_ids]
+            sessions = list(self.state.sessions.items())
+            ready_count = len(self.state.ready_ids)
+
+        tasks_by_status = Counter(t.status.value for t in tasks)
+        completed_with_branches = [
+            {'id': t.id, 'title': t.title, 'branch': t.branch}
+            for t in completed if t.branch
+        ]
+
+        # Separate main and worker sessions
+        main_session = None
+        worker_sessions = {}
+        for sid, s in sessions:
+            if s.role == "main":
+                main_session = {
+                    'session_id': sid,
+                    'working_on': s.working_on,
+                    'context': s.context,
+                    'last_heartbeat': s.last_heartbeat,
+                }
+            else:
+                worker_sessions[sid] = {
+                    'working_on': s.working_on,
+                    'context': s.context,
+                    'labels': s.labels,
+                    'branch': s.branch,
+                    'last_heartbeat': s.last_heartbeat,
+                }
 
-            return {
-                'total_tasks': len(self.state.tasks),
-                'tasks_by_status': tasks_by_status,
-                'ready_tasks': ready_count,
-                'main_session': main_session,
-                'worker_sessions': worker_sessions,
-                'active_workers': len(worker_sessions),
-                'completed_with_branches': completed_with_branches,
-            }
+        return {
+            'total_tasks': len(tasks),
+            'tasks_by_status': tasks_by_status,
+            'ready_tasks': ready_count,
+            'main_session': main_session,
+            'worker_sessions': worker_sessions,
+            'active_workers': len(worker_sessions),
+            'completed_with_branches': completed_with_branches,
+        }
 
     async def get_tasks(self, status: Optional[str] = None) -> list[dict]:
         async with self.state._lock:
             tasks = list(self.state.tasks.values())
-            if status:
-                tasks = [t for t in tasks if (t.status.value if isinstance(t.status, TaskStatus) else t.status) == status]
-            return [t.to_dict() for t in tasks]
+        if status:
+            # TaskStatus is a str enum, so members and plain strings both compare to status
+            tasks = [t for t in tasks if t.status == status]
+        return [t.to_dict() for t in tasks]
 
     async def get_parallel_summary(self) -> dict:
         """Get summary of parallel work for merge phase."""
         async with self.state._lock:
-            completed_tasks = [
-                t for t in self.state.tasks.values()
-                if t.status == TaskStatus.DONE
-            ]
-
-            # Group by branch
-            by_branch = {}
-            for task in completed_tasks:
-                branch = task.branch or 'main'
-                if branch not in by_branch:
-                    by_branch[branch] = []
-                by_branch[branch].append({
-                    'id': task.id,
-                    'title': task.title,
-                    'notes': task.notes[-3:] if task.notes else [],  # Last 3 notes
-                })
+            completed_tasks = [self.state.tasks[tid] for tid in self.state.done_ids]
+
+        # Group by branch
+        by_branch = {}
+        for task in completed_tasks:
+            branch = task.branch or 'main'
+            if branch not in by_branch:
+                by_branch[branch] = []
+            by_branch[branch].append({
+                'id': task.id,
+                'title': task.title,
+                'notes': list(islice(task.notes, max(0, len(task.notes) - 3), None)),  # Last 3 notes
+            })
 
-            return {
-                'total_completed': len(completed_tasks),
-                'branches': by_branch,
-                'branches_to_merge': [b for b in by_branch.keys() if b != 'main'],
-            }
+        return {
+            'total_completed': len(completed_tasks),
+            'branches': by_branch,
+            'branches_to_merge': [b for b in by_branch.keys() if b != 'main'],
+        }
 
 
 # ============================================================================
@@ -1117,24 +1334,31 @@ HTTP_STATUS_TEXT = {
 
 def _send_error(writer: asyncio.StreamWriter, status_code: int, message: str = "") -> bytes:
     """Helper to create error response."""
-    body = json.dumps({'error': message or HTTP_STATUS_TEXT.get(status_code, "Error")})
+    body = _json_dumps({'error': message or HTTP_STATUS_TEXT.get(status_code, "Error")})
     return (
         f"HTTP/1.1 {status_code} {HTTP_STATUS_TEXT.get(status_code, 'Error')}\r\n"
         f"Content-Type: application/json\r\n"
         f"Content-Length: {len(body)}\r\n"
         f"\r\n"
-        f"{body}"
-    ).encode()
+    ).encode('ascii') + body
 
 
 async def handle_request(coordinator: Coordinator, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
     try:
-        request_line = await reader.readline()
-        if not request_line:
+        # Read the whole header block in one call rather than line by line
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError as e:
+            head = e.partial  # Client closed early; parse what arrived
+        except asyncio.LimitOverrunError:
+            writer.write(_send_error(writer, 400, "Request headers too large"))
+            await writer.drain()
+            return
+        if not head:
             return
 
-        request_line = request_line.decode().strip()
-        parts = request_line.split(' ', 2)
+        lines = head.decode('latin-1').split('\r\n')
+        parts = lines[0].strip().split(' ', 2)
         if len(parts) < 2:
             writer.write(_send_error(writer, 400, "Malformed request line"))
             await writer.drain()
@@ -1142,13 +1366,10 @@ async def handle_request(coordinator: Coordinator, reader: asyncio.StreamReader,
         method, path = parts[0], parts[1]
 
         headers = {}
-        while True:
-            line = await reader.readline()
-            if line == b'\r\n' or line == b'\n' or not line:
-                break
-            if b': ' in line:
-                key, value = line.decode().strip().split(': ', 1)
-                headers[key.lower()] = value
+        for line in lines[1:]:
+            key, sep, value = line.partition(': ')
+            if sep:
+                headers[key.lower()] = value.strip()
 
         body = b''
         if 'content-length' in headers:
@@ -1167,25 +1388,26 @@ async def handle_request(coordinator: Coordinator, reader: asyncio.StreamReader,
         data = {}
         if body:
             try:
-                data = json.loads(body.decode())
-            except json.JSONDecodeError:
+                data = _json_loads(body)
+            except ValueError:  # Bad JSON or bad UTF-8
                 writer.write(_send_error(writer, 400, "Invalid JSON body"))
                 await writer.drain()
                 return
 
         response_data, status_code = await route_request(coordinator, method, path, data)
-        response_body = json.dumps(response_data, indent=2)
+        response_body = _json_dumps(response_data, indent=True)
 
-        response = (
+        # Keep the body as bytes: Content-Length counts bytes, and the body
+        # isn't copied into a combined string and re-encoded
+        header = (
             f"HTTP/1.1 {status_code} {HTTP_STATUS_TEXT.get(status_code, 'OK')}\r\n"
             f"Content-Type: application/json\r\n"
             f"Content-Length: {len(response_body)}\r\n"
             f"Access-Control-Allow-Origin: *\r\n"
             f"\r\n"
-            f"{response_body}"
-        )
+        ).encode('ascii')
 
-        writer.write(response.encode())
+        writer.writelines((header, response_body))
         await writer.drain()
 
     except Exception as e:
@@ -1197,188 +1419,229 @@ async def handle_request(coordinator: Coordinator, reader: asyncio.StreamReader,
         await writer.wait_closed()
 
 
+async def _route_status(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    return await coordinator.get_status(), 200
+
+
+async def _route_parallel_summary(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    return await coordinator.get_parallel_summary(), 200
+
+
+async def _route_session_register(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    session = await coordinator.register_session(
+        session_id=data.get('session_id'),
+        role=data.get('role', 'worker'),
+        context=data.get('context', ''),
+        labels=data.get('labels', []),
+        branch=data.get('branch'),
+    )
+    return session.to_dict(), 200
+
+
+async def _route_session_heartbeat(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'session_id' not in data:
+        return {'error': 'Missing required field: session_id'}, 422
+    success = await coordinator.heartbeat(data['session_id'])
+    return {'success': success}, 200
+
+
+async def _route_session_end(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'session_id' not in data:
+        return {'error': 'Missing required field: session_id'}, 422
+    await coordinator.end_session(
+        data['session_id'],
+        release_tasks=data.get('release_tasks', True),
+    )
+    return {'success': True}, 200
+
+
+async def _route_flush(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    # Write a full snapshot now, for callers that read tasks.json directly
+    await coordinator.state.save()
+    return {'success': True}, 200
+
+
+async def _route_task_create(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'title' not in data:
+        return {'error': 'Missing required field: title'}, 422
+    task = await coordinator.create_task(
+        title=data['title'],
+        description=data.get('description', ''),
+        priority=data.get('priority', 2),
+        blocked_by=data.get('blocked_by', []),
+        labels=data.get('labels', []),
+        branch=data.get('branch'),
+        session_id=data.get('session_id'),
+    )
+    return task.to_dict(), 200
+
+
+async def _route_task_request(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'session_id' not in data:
+        return {'error': 'Missing required field: session_id'}, 422
+    task = await coordinator.request_task(
+        session_id=data['session_id'],
+        preferred_labels=data.get('preferred_labels', []),
+    )
+    if task:
+        return {'task': task.to_dict()}, 200
+    return {'task': None}, 200
+
+
+async def _route_task_complete(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'task_id' not in data or 'session_id' not in data:
+        return {'error': 'Missing required fields: task_id, session_id'}, 422
+    result = await coordinator.complete_task(
+        task_id=data['task_id'],
+        session_id=data['session_id'],
+        completion_note=data.get('note', ''),
+        branch=data.get('branch'),
+        force=data.get('force', False),
+    )
+    # Result is now a dict with success/error/incomplete_subtasks
+    return result, 200 if result.get('success') else 400
+
+
+async def _route_task_note(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'task_id' not in data or 'session_id' not in data or 'note' not in data:
+        return {'error': 'Missing required fields: task_id, session_id, note'}, 422
+    success = await coordinator.add_note(
+        task_id=data['task_id'],
+        session_id=data['session_id'],
+        note=data['note'],
+    )
+    if success:
+        return {'success': True}, 200
+    return {'success': False, 'error': 'Task not found'}, 404
+
+
+async def _route_task_reopen(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'task_id' not in data or 'session_id' not in data:
+        return {'error': 'Missing required fields: task_id, session_id'}, 422
+    task = await coordinator.reopen_task(
+        task_id=data['task_id'],
+        session_id=data['session_id'],
+        note=data.get('note', ''),
+    )
+    if task:
+        return {'success': True, 'task': task.to_dict()}, 200
+    return {'success': False, 'error': 'Task not found'}, 404
+
+
+async def _route_task_bulk_complete(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'task_ids' not in data or 'session_id' not in data:
+        return {'error': 'Missing required fields: task_ids, session_id'}, 422
+    result = await coordinator.bulk_complete_tasks(
+        task_ids=data['task_ids'],
+        session_id=data['session_id'],
+        completion_note=data.get('note', ''),
+        branch=data.get('branch'),
+        force=data.get('force', False),
+    )
+    return result, 200
+
+
+async def _route_task_bulk_reopen(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'task_ids' not in data or 'session_id' not in data:
+        return {'error': 'Missing required fields: task_ids, session_id'}, 422
+    result = await coordinator.bulk_reopen_tasks(
+        task_ids=data['task_ids'],
+        session_id=data['session_id'],
+        note=data.get('note', ''),
+    )
+    return result, 200
+
+
+async def _route_task_edit(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'task_id' not in data or 'session_id' not in data:
+        return {'error': 'Missing required fields: task_id, session_id'}, 422
+    task = await coordinator.edit_task(
+        task_id=data['task_id'],
+        session_id=data['session_id'],
+        title=data.get('title'),
+        description=data.get('description'),
+        priority=data.get('priority'),
+        labels=data.get('labels'),
+    )
+    if task:
+        return {'task': task.to_dict()}, 200
+    return {'error': 'Task not found'}, 404
+
+
+async def _route_task_delete(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'task_id' not in data or 'session_id' not in data:
+        return {'error': 'Missing required fields: task_id, session_id'}, 422
+    result = await coordinator.delete_task(
+        task_id=data['task_id'],
+        session_id=data['session_id'],
+        force=data.get('force', False),
+    )
+    return result, 200 if result.get('success') else 400
+
+
+async def _route_task_create_subtask(coordinator: Coordinator, data: dict) -> tuple[dict, int]:
+    if 'parent_id' not in data or 'title' not in data:
+        return {'error': 'Missing required fields: parent_id, title'}, 422
+    task = await coordinator.create_subtask(
+        parent_id=data['parent_id'],
+        title=data['title'],
+        description=data.get('description', ''),
+        priority=data.get('priority'),
+        labels=data.get('labels'),
+        session_id=data.get('session_id'),
+    )
+    if task:
+        return {'task': task.to_dict()}, 200
+    return {'error': 'Parent task not found'}, 404
+
+
+# Exact-match routes, keyed by (method, path)
+ROUTES = {
+    ('GET', '/status'): _route_status,
+    ('GET', '/parallel-summary'): _route_parallel_summary,
+    ('POST', '/session/register'): _route_session_register,
+    ('POST', '/session/heartbeat'): _route_session_heartbeat,
+    ('POST', '/session/end'): _route_session_end,
+    ('POST', '/flush'): _route_flush,
+    ('POST', '/task/create'): _route_task_create,
+    ('POST', '/task/request'): _route_task_request,
+    ('POST', '/task/complete'): _route_task_complete,
+    ('POST', '/task/note'): _route_task_note,
+    ('POST', '/task/reopen'): _route_task_reopen,
+    ('POST', '/task/bulk-complete'): _route_task_bulk_complete,
+    ('POST', '/task/bulk-reopen'): _route_task_bulk_reopen,
+    ('POST', '/task/edit'): _route_task_edit,
+    ('POST', '/task/delete'): _route_task_delete,
+    ('POST', '/task/create-subtask'): _route_task_create_subtask,
+}
+
+
 async def route_request(coordinator: Coordinator, method: str, path: str, data: dict) -> tuple[dict, int]:
     """Route request to appropriate handler. Returns (response_data, status_code)."""
     try:
-        if method == 'GET' and path == '/status':
-            return await coordinator.get_status(), 200
-
-        if method == 'GET' and path == '/parallel-summary':
-            return await coordinator.get_parallel_summary(), 200
-
-        if method == 'GET' and path.startswith('/tasks'):
-            status = None
-            if '?' in path:
-                for param in path.split('?')[1].split('&'):
-                    if param.startswith('status='):
-                        status = param.split('=')[1]
-            return {'tasks': await coordinator.get_tasks(status)}, 200
-
-        if method == 'POST' and path == '/session/register':
-            session = await coordinator.register_session(
-                session_id=data.get('session_id'),
-                role=data.get('role', 'worker'),
-                context=data.get('context', ''),
-                labels=data.get('labels', []),
-                branch=data.get('branch'),
-            )
-            return session.to_dict(), 200
-
-        if method == 'POST' and path == '/session/heartbeat':
-            if 'session_id' not in data:
-                return {'error': 'Missing required field: session_id'}, 422
-            success = await coordinator.heartbeat(data['session_id'])
-            return {'success': success}, 200
-
-        if method == 'POST' and path == '/session/end':
-            if 'session_id' not in data:
-                return {'error': 'Missing required field: session_id'}, 422
-            await coordinator.end_session(
-                data['session_id'],
-                release_tasks=data.get('release_tasks', True),
-            )
-            return {'success': True}, 200
-
-        if method == 'POST' and path == '/task/create':
-            if 'title' not in data:
-                return {'error': 'Missing required field: title'}, 422
-            task = await coordinator.create_task(
-                title=data['title'],
-                description=data.get('description', ''),
-                priority=data.get('priority', 2),
-                blocked_by=data.get('blocked_by', []),
-                labels=data.get('labels', []),
-                branch=data.get('branch'),
-                session_id=data.get('session_id'),
-            )
-            return task.to_dict(), 200
-
-        if method == 'POST' and path == '/task/request':
-            if 'session_id' not in data:
-                return {'error': 'Missing required field: session_id'}, 422
-            task = await coordinator.request_task(
-                session_id=data['session_id'],
-                preferred_labels=data.get('preferred_labels', []),
-            )
-            if task:
-                return {'task': task.to_dict()}, 200
-            return {'task': None}, 200
-
-        if method == 'POST' and path == '/task/complete':
-            if 'task_id' not in data or 'session_id' not in data:
-                return {'error': 'Missing required fields: task_id, session_id'}, 422
-            result = await coordinator.complete_task(
-                task_id=data['task_id'],
-                session_id=data['session_id'],
-                completion_note=data.get('note', ''),
-                branch=data.get('branch'),
-                force=data.get('force', False),
-            )
-            # Result is now a dict with success/error/incomplete_subtasks
-            return result, 200 if result.get('success') else 400
-
-        if method == 'POST' and path == '/task/note':
-            if 'task_id' not in data or 'session_id' not in data or 'note' not in data:
-                return {'error': 'Missing required fields: task_id, session_id, note'}, 422
-            success = await coordinator.add_note(
-                task_id=data['task_id'],
-                session_id=data['session_id'],
-                note=data['note'],
-            )
-            if success:
-                return {'success': True}, 200
-            return {'success': False, 'error': 'Task not found'}, 404
-
-        if method == 'POST' and path == '/task/reopen':
-            if 'task_id' not in data or 'session_id' not in data:
-                return {'error': 'Missing required fields: task_id, session_id'}, 422
-            task = await coordinator.reopen_task(
-                task_id=data['task_id'],
-                session_id=data['session_id'],
-                note=data.get('note', ''),
-            )
-            if task:
-                return {'success': True, 'task': task.to_dict()}, 200
-            return {'success': False, 'error': 'Task not found'}, 404
-
-        # Bulk operations
-        if method == 'POST' and path == '/task/bulk-complete':
-            if 'task_ids' not in data or 'session_id' not in data:
-                return {'error': 'Missing required fields: task_ids, session_id'}, 422
-            result = await coordinator.bulk_complete_tasks(
-                task_ids=data['task_ids'],
-                session_id=data['session_id'],
-                completion_note=data.get('note', ''),
-                branch=data.get('branch'),
-                force=data.get('force', False),
-            )
-            return result, 200
-
-        if method == 'POST' and path == '/task/bulk-reopen':
-            if 'task_ids' not in data or 'session_id' not in data:
-                return {'error': 'Missing required fields: task_ids, session_id'}, 422
-            result = await coordinator.bulk_reopen_tasks(
-                task_ids=data['task_ids'],
-                session_id=data['session_id'],
-                note=data.get('note', ''),
-            )
-            return result, 200
-
-        # Edit and delete routes
-        if method == 'POST' and path == '/task/edit':
-            if 'task_id' not in data or 'session_id' not in data:
-                return {'error': 'Missing required fields: task_id, session_id'}, 422
-            task = await coordinator.edit_task(
-                task_id=data['task_id'],
-                session_id=data['session_id'],
-                title=data.get('title'),
-                description=data.get('description'),
-                priority=data.get('priority'),
-                labels=data.get('labels'),
-            )
-            if task:
-                return {'task': task.to_dict()}, 200
-            return {'error': 'Task not found'}, 404
-
-        if method == 'POST' and path == '/task/delete':
-            if 'task_id' not in data or 'session_id' not in data:
-                return {'error': 'Missing required fields: task_id, session_id'}, 422
-            result = await coordinator.delete_task(
-                task_id=data['task_id'],
-                session_id=data['session_id'],
-                force=data.get('force', False),
-            )
-            return result, 200 if result.get('success') else 400
-
-        # Subtask routes
-        if method == 'POST' and path == '/task/create-subtask':
-            if 'parent_id' not in data or 'title' not in data:
-                return {'error': 'Missing required fields: parent_id, title'}, 422
-            task = await coordinator.create_subtask(
-                parent_id=data['parent_id'],
-                title=data['title'],
-                description=data.get('description', ''),
-                priority=data.get('priority'),
-                labels=data.get('labels'),
-                session_id=data.get('session_id'),
-            )
-            if task:
-                return {'task': task.to_dict()}, 200
-            return {'error': 'Parent task not found'}, 404
-
-        # Match /task/{task_id}/subtask-progress
-        if method == 'GET' and path.startswith('/task/') and path.endswith('/subtask-progress'):
-            task_id = path.split('/')[2]
-            progress = await coordinator.get_subtask_progress(task_id)
-            if progress is not None:
-                return progress, 200
-            return {'error': 'Task not found'}, 404
-
-        # Match /task/{task_id}/subtasks
-        if method == 'GET' and path.startswith('/task/') and path.endswith('/subtasks'):
-            task_id = path.split('/')[2]
-            subtasks = await coordinator.get_subtasks(task_id)
-            return {'subtasks': subtasks}, 200
+        handler = ROUTES.get((method, path))
+        if handler is not None:
+            return await handler(coordinator, data)
+
+        if method == 'GET':
+            # /tasks carries a query string, so it can't be an exact-match key
+            if path.startswith('/tasks'):
+                status = parse_qs(urlsplit(path).query).get('status', [None])[0]
+                return {'tasks': await coordinator.get_tasks(status)}, 200
+
+            # Match /task/{task_id}/subtask-progress
+            if path.startswith('/task/') and path.endswith('/subtask-progress'):
+                task_id = path.split('/')[2]
+                progress = await coordinator.get_subtask_progress(task_id)
+                if progress is not None:
+                    return progress, 200
+                return {'error': 'Task not found'}, 404
+
+            # Match /task/{task_id}/subtasks
+            if path.startswith('/task/') and path.endswith('/subtasks'):
+                task_id = path.split('/')[2]
+                subtasks = await coordinator.get_subtasks(task_id)
+                return {'subtasks': subtasks}, 200
 
         return {'error': f'Unknown route: {method} {path}'}, 404
 
@@ -1393,9 +1656,18 @@ async def stale_monitor(coordinator: Coordinator):
 
 
 async def periodic_save(state: CoordinatorState):
+    # Snapshots fold the mutation journal back into the state file. Only
+    # snapshot after something was journaled, at most once per 30s; the
+    # journal keeps those changes durable in between.
     while True:
+        await state._dirty.wait()
         await asyncio.sleep(30)
-        await state.save()
+        try:
+            await state.save()
+        except Exception as e:
+            # The journal still holds these changes; retry next cycle
+            logger.error(f"Snapshot failed: {e}")
+            state._dirty.set()
 
 
 async def main(port: int, state_file: Path):
@@ -1420,8 +1692,19 @@ async def main(port: int, state_file: Path):
     addr = server.sockets[0].getsockname()
     logger.info(f"Coordinator running on http://{addr[0]}:{addr[1]}")
 
+    # Stop cleanly on SIGTERM (sent by stop_parallel_mode) so the final
+    # snapshot includes journaled mutations; Windows lacks signal handlers
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, stop.set)
+    except (NotImplementedError, AttributeError):
+        pass
+
     async with server:
-        await server.serve_forever()
+        await stop.wait()
+    await state.save()
+    logger.info("Coordinator stopped")
 
 
 if __name__ == '__main__':
@@ -1430,6 +1713,13 @@ if __name__ == '__main__':
     parser.add_argument('--state', type=Path, default=Path('.agent-state/tasks.json'))
     args = parser.parse_args()
 
+    # Optional libuv-based event loop (pip install 'claudia[fast]', not on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main(args.port, args.state))
     except KeyboardInterrupt:
@@ -37,6 +37,18 @@ except ImportError:
         return True
 
 
+# Journal replay, so parallel-mode changes not yet snapshotted show up
+try:
+    from claudia.agent import replay_journal
+except ImportError:
+    try:
+        from agent import replay_journal
+    except ImportError:
+        # Standalone without agent.py: show tasks.json as-is
+        def replay_journal(data: dict, journal_file: Path) -> int:
+            return 0
+
+
 # Import colors from shared module
 try:
     from claudia.colors import Colors, priority_str
@@ -94,25 +106,56 @@ def time_ago(iso_time: str) -> str:
         return "?"
 
 
+# Parsed session files from the previous refresh, keyed by path. An entry is
+# reused while the file's (mtime_ns, size) is unchanged; files that have
+# disappeared drop out on the next refresh.
+_session_cache: dict = {}
+
+
+def _load_sessions(sessions_dir: Path) -> dict:
+    """Load session files by session ID, skipping unchanged files' re-parse."""
+    global _session_cache
+    sessions = {}
+    seen = {}
+    with os.scandir(sessions_dir) as it:
+        for entry in it:
+            if not (entry.name.startswith('session-') and entry.name.endswith('.json')):
+                continue
+            try:
+                st = entry.stat()
+                key = (st.st_mtime_ns, st.st_size)
+                cached = _session_cache.get(entry.path)
+                if cached is not None and cached[0] == key:
+                    s = cached[1]
+                else:
+                    with open(entry.path, 'rb') as f:
+                        s = json.loads(f.read())
+                sessions[s['session_id']] = s
+                seen[entry.path] = (key, s)
+            except (json.JSONDecodeError, OSError, KeyError):
+                continue  # Skip malformed session files
+    _session_cache = seen
+    return sessions
+
+
 def load_state_direct(state_dir: Path) -> dict:
     """Load state directly from files (no agent/coordinator)."""
     tasks_file = state_dir / 'tasks.json'
-    if not tasks_file.exists():
+    journal_file = state_dir / 'tasks.jsonl'
+    if tasks_file.exists():
+        data = json.loads(tasks_file.read_text())
+    elif journal_file.exists():
+        data = {}  # Coordinator never snapshotted; everything is in the journal
+    else:
         return {'tasks': [], 'sessions': {}, 'mode': 'single'}
 
-    data = json.loads(tasks_file.read_text())
+    # Read-only: the coordinator (or the next single-mode load) folds it in
+    replay_journal(data, journal_file)
     tasks = data.get('tasks', [])
 
     # Load sessions
-    sessions = {}
     sessions_dir = state_dir / 'sessions'
-    if sessions_dir.exists():
-        for f in sessions_dir.glob('session-*.json'):
-            try:
-                s = json.loads(f.read_text())
-                sessions[s['session_id']] = s
-            except (json.JSONDecodeError, OSError, KeyError):
-                continue  # Skip malformed session files
+    sessions = _load_sessions(sessions_dir) if sessions_dir.exists() else {}
 
     # Check mode
     mode = 'parallel' if (state_dir / '.parallel-mode').exists() else 'single'
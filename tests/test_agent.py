@@ -68,6 +68,16 @@ class TestTaskCRUD:
         done_tasks = agent_with_tasks.get_tasks(status='done')
         assert len(done_tasks) == 1
 
+    def test_get_task(self, agent_with_tasks):
+        """Test getting a single task by ID."""
+        assert agent_with_tasks.get_task('task-002')['title'] == 'Second task'
+        assert agent_with_tasks.get_task('task-999') is None
+
+    def test_get_tasks_by_ids(self, agent_with_tasks):
+        """Test fetching several tasks by ID."""
+        found = agent_with_tasks.get_tasks_by_ids(['task-001', 'task-004', 'task-999'])
+        assert sorted(found) == ['task-001', 'task-004']
+
     def test_edit_task(self, agent_with_tasks):
         """Test editing a task."""
         task = agent_with_tasks.edit_task(
@@ -370,6 +380,9 @@ class TestArchiving:
         assert len(archived) == 1
         assert archived[0]['id'] == 'task-004'
 
+        assert agent_with_tasks.is_archived('task-004')
+        assert not agent_with_tasks.is_archived('task-001')
+
         # Restore
         task = agent_with_tasks.restore_from_archive('task-004')
         assert task is not None
@@ -378,6 +391,65 @@ class TestArchiving:
         # Should be back in tasks
         tasks = agent_with_tasks.get_tasks()
         assert any(t['id'] == 'task-004' for t in tasks)
+        assert not agent_with_tasks.is_archived('task-004')
+
+    def test_list_archived_limit(self, agent_with_tasks):
+        """Test list_archived returns the most recent entries up to limit."""
+        archive_file = agent_with_tasks.state_dir / 'archive.jsonl'
+        archive_file.write_text(''.join(
+            json.dumps({'id': f'task-{i:03d}', 'title': f'Old {i}'}) + '\n' for i in range(1, 6)
+        ) + 'not json\n')
+
+        archived = agent_with_tasks.list_archived(limit=2)
+        assert [t['id'] for t in archived] == ['task-005', 'task-004']
+
+
+class TestCoordinatorJournal:
+    """Single mode picking up a journal left by a coordinator that didn't snapshot."""
+
+    def _write_journal(self, state_dir, *events):
+        (state_dir / 'tasks.jsonl').write_text(''.join(json.dumps(e) + '\n' for e in events))
+
+    def _task(self, task_id, title):
+        return {'id': task_id, 'title': title, 'status': 'open', 'priority': 2,
+                'blocked_by': [], 'assignee': None, 'labels': [], 'notes': []}
+
+    def test_load_replays_and_folds_journal(self, agent, temp_state_dir):
+        """Journaled tasks are visible, folded into tasks.json, and ids aren't reused."""
+        self._write_journal(
+            temp_state_dir,
+            {'gen': 0, 'next_id': 2, 'tasks': [self._task('task-001', 'a')]},
+            {'gen': 0, 'next_id': 3, 'tasks': [self._task('task-002', 'b')]},
+        )
+
+        assert [t['title'] for t in agent.get_tasks()] == ['a', 'b']
+        assert not (temp_state_dir / 'tasks.jsonl').exists()
+        data = json.loads((temp_state_dir / 'tasks.json').read_text())
+        assert [t['id'] for t in data['tasks']] == ['task-001', 'task-002']
+        assert data['journal_gen'] == 1
+
+        assert agent.create_task(title='c')['id'] == 'task-003'
+
+    def test_journal_without_snapshot(self, agent, temp_state_dir):
+        """A coordinator killed before its first snapshot leaves only the journal."""
+        (temp_state_dir / 'tasks.json').unlink()
+        self._write_journal(
+            temp_state_dir,
+            {'gen': 0, 'next_id': 2, 'tasks': [self._task('task-001', 'a')]},
+        )
+        assert [t['id'] for t in agent.get_tasks()] == ['task-001']
+
+    def test_dashboard_replays_without_folding(self, temp_state_dir):
+        """The dashboard shows journaled tasks but leaves the journal alone."""
+        from claudia.dashboard import load_state_direct
+
+        self._write_journal(
+            temp_state_dir,
+            {'gen': 0, 'next_id': 2, 'tasks': [self._task('task-001', 'a')]},
+        )
+        state = load_state_direct(temp_state_dir)
+        assert state['total_tasks'] == 1
+        assert (temp_state_dir / 'tasks.jsonl').exists()
 
 
 class TestIsTaskReady:
@@ -3,8 +3,10 @@ Tests for the CLI module.
 """
 
 import json
+import os
 import subprocess
 import sys
+import time
 
 
 
@@ -29,6 +31,33 @@ class TestCLICommands:
             text=True
         )
         assert result.returncode == 0
+        assert result.stdout.startswith('claudia ')
+
+    def test_cli_update_check_uses_cache(self, tmp_path):
+        """Test update --check answers from a fresh cache without the network."""
+        cache_dir = tmp_path / 'claudia'
+        cache_dir.mkdir()
+        (cache_dir / 'latest_release.json').write_text(json.dumps({'tag_name': 'v99.0.0'}))
+
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', 'update', '--check'],
+            capture_output=True,
+            text=True,
+            env={**os.environ, 'XDG_CACHE_HOME': str(tmp_path)},
+        )
+        assert result.returncode == 0
+        assert 'New version available: 99.0.0' in result.stdout
+
+    def test_update_cache_rejects_non_object(self, tmp_path):
+        """Test a cache file holding valid non-object JSON is treated as corrupt."""
+        from claudia.cli import _read_update_cache
+
+        cache_file = tmp_path / 'latest_release.json'
+        for content in ('[]', 'null', '"v1.0.0"'):
+            cache_file.write_text(content)
+            assert _read_update_cache(cache_file) is None
+        cache_file.write_text(json.dumps({'tag_name': 'v1.0.0'}))
+        assert _read_update_cache(cache_file) == {'tag_name': 'v1.0.0'}
 
     def test_cli_status(self, temp_state_dir):
         """Test status command."""
@@ -76,6 +105,21 @@ class TestCLICommands:
         assert data['id'] == 'task-001'
         assert data['title'] == 'Test task'
 
+    def test_cli_create_interactive_piped(self, temp_state_dir):
+        """Test interactive create reads a multi-line description from a pipe."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', '--state-dir', str(temp_state_dir),
+             'create', '-i'],
+            input='Piped task\n1\nbug\nline one\nline two\n\n\ny\n',
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        task = json.loads((temp_state_dir / 'tasks.json').read_text())['tasks'][0]
+        assert task['title'] == 'Piped task'
+        assert task['priority'] == 1
+        assert task['description'] == 'line one\nline two'
+
     def test_cli_tasks(self, temp_state_dir, sample_tasks):
         """Test tasks command."""
         result = subprocess.run(
@@ -98,6 +142,30 @@ class TestCLICommands:
         assert 'task-004' in result.stdout
         assert 'task-001' not in result.stdout
 
+    def test_cli_tasks_search(self, temp_state_dir, sample_tasks):
+        """Test tasks command with case-insensitive search."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', '--state-dir', str(temp_state_dir),
+             '--json', 'tasks', '--search', 'BLOCKED'],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        data = json.loads(result.stdout)
+        assert [t['id'] for t in data] == ['task-003']
+
+    def test_cli_tasks_search_any_term(self, temp_state_dir, sample_tasks):
+        """Test repeated --search matches tasks containing any of the terms."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', '--state-dir', str(temp_state_dir),
+             '--json', 'tasks', '-s', 'blocked', '-s', 'FIRST'],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        data = json.loads(result.stdout)
+        assert sorted(t['id'] for t in data) == ['task-001', 'task-003']
+
     def test_cli_show(self, temp_state_dir, sample_tasks):
         """Test show command."""
         result = subprocess.run(
@@ -110,6 +178,30 @@ class TestCLICommands:
         assert 'First task' in result.stdout
         assert 'P1' in result.stdout
 
+    def test_cli_complete_unknown_suggests(self, temp_state_dir, sample_tasks):
+        """Test completing a missing task lists available tasks."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', '--state-dir', str(temp_state_dir),
+             'complete', 'task-999'],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        assert "Task 'task-999' not found" in result.stdout
+        assert 'task-001' in result.stdout
+
+    def test_cli_reopen(self, temp_state_dir, sample_tasks):
+        """Test reopening a completed task."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', '--state-dir', str(temp_state_dir),
+             'reopen', 'task-004'],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        assert 'Reopened task-004' in result.stdout
+        assert '(was done)' in result.stdout
+
     def test_cli_dry_run(self, temp_state_dir, sample_tasks):
         """Test --dry-run flag."""
         result = subprocess.run(
@@ -132,6 +224,72 @@ class TestCLICommands:
         assert len(data) == 0
 
 
+class TestCLIInit:
+    """Test init/uninstall CLI commands."""
+
+    def test_init_creates_state(self, tmp_path):
+        """Test init creates state files, .gitignore and CLAUDE.md."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', 'init', str(tmp_path)],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        state_dir = tmp_path / '.agent-state'
+        assert json.loads((state_dir / 'tasks.json').read_text())['tasks'] == []
+        assert (state_dir / 'history.jsonl').exists()
+        assert (state_dir / 'sessions' / '.gitkeep').exists()
+        assert '.agent-state/coordinator.pid' in (tmp_path / '.gitignore').read_text()
+        assert 'Claudia Task Coordination' in (tmp_path / 'CLAUDE.md').read_text()
+
+    def test_init_force_is_idempotent(self, tmp_path):
+        """Test re-running init keeps existing files and doesn't duplicate entries."""
+        (tmp_path / '.gitignore').write_text('node_modules/\n')
+        for _ in range(2):
+            subprocess.run(
+                [sys.executable, '-m', 'claudia.cli', 'init', '--force', str(tmp_path)],
+                capture_output=True,
+                text=True
+            )
+        gitignore = (tmp_path / '.gitignore').read_text()
+        assert gitignore.startswith('node_modules/\n')
+        assert gitignore.count('.agent-state/.parallel-mode') == 1
+        assert (tmp_path / 'CLAUDE.md').read_text().count('# Claudia Task Coordination') == 1
+
+    def test_uninstall_cleans_gitignore(self, tmp_path):
+        """Test uninstall strips Claudia entries and collapses blank lines."""
+        (tmp_path / '.gitignore').write_text('node_modules/\n\n\n\n')
+        subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', 'init', str(tmp_path)],
+            capture_output=True,
+            text=True
+        )
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', 'uninstall', '--force', str(tmp_path)],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        assert not (tmp_path / '.agent-state').exists()
+        assert (tmp_path / '.gitignore').read_text() == 'node_modules/\n'
+
+    def test_uninstall_restores_claude_md(self, tmp_path):
+        """Test uninstall removes only the appended Claudia section from CLAUDE.md."""
+        original = '# My Project\n\nBuild with make.\n'
+        (tmp_path / 'CLAUDE.md').write_text(original)
+        subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', 'init', str(tmp_path)],
+            capture_output=True,
+            text=True
+        )
+        subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', 'uninstall', '--force', str(tmp_path)],
+            capture_output=True,
+            text=True
+        )
+        assert (tmp_path / 'CLAUDE.md').read_text() == original
+
+
 class TestCLISubtasks:
     """Test subtask CLI commands."""
 
@@ -321,3 +479,88 @@ class TestCLIDelete:
             text=True
         )
         assert 'First task' in result2.stdout
+
+
+class TestCLISessions:
+    """Test session CLI commands."""
+
+    def test_session_cleanup_threshold(self, temp_state_dir):
+        """Test session cleanup -t only removes sessions older than the threshold."""
+        (temp_state_dir / 'sessions' / 'session-idle.json').write_text(json.dumps({
+            'session_id': 'idle',
+            'last_heartbeat': '2024-01-15T10:00:00Z',
+        }))
+
+        def cleanup(threshold):
+            result = subprocess.run(
+                [sys.executable, '-m', 'claudia.cli', '--state-dir', str(temp_state_dir),
+                 '--json', 'session', 'cleanup', '-t', str(threshold)],
+                capture_output=True,
+                text=True
+            )
+            assert result.returncode == 0
+            return result.stdout
+
+        assert 'No stale sessions' in cleanup(10**10)
+        assert json.loads(cleanup(30))['removed'] == ['idle']
+
+    def test_session_show_json(self, temp_state_dir, sample_tasks):
+        """Test session details resolve working_on task titles."""
+        session = {
+            'session_id': 'abc123',
+            'role': 'worker',
+            'context': 'Testing',
+            'working_on': ['task-001', 'task-999'],
+            'last_heartbeat': '2024-01-15T10:00:00Z',
+        }
+        (temp_state_dir / 'sessions' / 'session-abc123.json').write_text(json.dumps(session))
+
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', '--state-dir', str(temp_state_dir),
+             '--json', 'session', 'abc123'],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        data = json.loads(result.stdout)
+        assert data['working_on_details'] == [
+            {'id': 'task-001', 'title': 'First task', 'priority': 1},
+        ]
+
+    def test_session_list_json(self, temp_state_dir):
+        """Test session list reads session files and skips other files."""
+        sessions_dir = temp_state_dir / 'sessions'
+        (sessions_dir / 'session-abc123.json').write_text(json.dumps({'session_id': 'abc123'}))
+        (sessions_dir / 'session-broken.json').write_text('{not json')
+        (sessions_dir / '.gitkeep').write_text('')
+
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', '--state-dir', str(temp_state_dir),
+             '--json', 'session'],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        assert [s['session_id'] for s in json.loads(result.stdout)] == ['abc123']
+
+    def test_session_cleanup_removes_stale(self, temp_state_dir):
+        """Test session cleanup removes stale and corrupt sessions only."""
+        sessions_dir = temp_state_dir / 'sessions'
+        stale = sessions_dir / 'session-old.json'
+        stale.write_text(json.dumps({'session_id': 'old', 'last_heartbeat': '2024-01-15T10:00:00Z'}))
+        os.utime(stale, (0, 0))
+        (sessions_dir / 'session-broken.json').write_text('{not json')
+        (sessions_dir / 'session-live.json').write_text(json.dumps({
+            'session_id': 'live',
+            'last_heartbeat': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        }))
+
+        result = subprocess.run(
+            [sys.executable, '-m', 'claudia.cli', '--state-dir', str(temp_state_dir),
+             '--json', 'session', 'cleanup'],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        assert sorted(json.loads(result.stdout)['removed']) == ['broken', 'old']
+        assert (sessions_dir / 'session-live.json').exists()
@@ -66,6 +66,20 @@ class TestColorsFormatting:
         assert 'P3' in p3
         assert '\033[2m' in p3  # Dim code
 
+    def test_format_priority_unknown(self, monkeypatch):
+        """Test out-of-range and non-integer priorities fall back instead of raising."""
+        monkeypatch.setenv('FORCE_COLOR', '1')
+
+        from importlib import reload
+        import claudia.colors
+        reload(claudia.colors)
+
+        from claudia.colors import Colors
+
+        for priority in (None, 'high', 7):
+            assert Colors.priority_color(priority) == Colors.RESET
+            assert 'P?' in Colors.format_priority(priority)
+
     def test_format_status(self, monkeypatch):
         """Test status formatting."""
         monkeypatch.setenv('FORCE_COLOR', '1')
@@ -0,0 +1,241 @@
+"""
+Tests for the coordinator: task claiming, persistence (snapshot + journal
+replay) and task indexes.
+"""
+
+import json
+from unittest import mock
+
+import pytest
+
+from claudia.coordinator import Coordinator, CoordinatorState, TaskStatus, _now_iso
+
+
+@pytest.fixture
+def state_file(temp_state_dir):
+    """Path to a coordinator state file that doesn't exist yet."""
+    path = temp_state_dir / 'tasks.json'
+    path.unlink()
+    return path
+
+
+@pytest.fixture
+def coordinator(state_file):
+    """Coordinator on a fresh state that is never snapshotted unless a test saves."""
+    return Coordinator(CoordinatorState(state_file), auto_shutdown=False)
+
+
+async def restart(state_file):
+    """Load state from disk the way a restarted coordinator does."""
+    state = CoordinatorState(state_file)
+    await state.load()
+    return state
+
+
+def task_dicts(state):
+    return {tid: t.to_dict() for tid, t in state.tasks.items()}
+
+
+def assert_indexes_consistent(state):
+    ready = {t.id for t in state.tasks.values() if state.is_ready(t)}
+    done = {t.id for t in state.tasks.values() if t.status == TaskStatus.DONE}
+    assert set(state.ready_ids) == ready
+    assert set(state.done_ids) == done
+
+
+class TestTimestamps:
+    """_now_iso formatting."""
+
+    def test_now_iso_matches_its_cache_granularity(self):
+        """Timestamps carry milliseconds only, so a cached value is never stale."""
+        with mock.patch('claudia.coordinator.time.time', return_value=1700000000.1234567):
+            first = _now_iso()
+        with mock.patch('claudia.coordinator.time.time', return_value=1700000000.1239):
+            assert _now_iso() == first
+        assert first == '2023-11-14T22:13:20.123+00:00Z'
+
+
+class TestClaiming:
+    """Task assignment through request_task."""
+
+    @pytest.mark.asyncio
+    async def test_claim_uses_session_label_affinity(self, coordinator):
+        """A registered session's labels feed the affinity score, and the claim succeeds."""
+        await coordinator.register_session(session_id='w1', labels=['backend', 'api'])
+        await coordinator.create_task(title='Styling', labels=['frontend'])
+        task = await coordinator.create_task(title='Endpoint', labels=['backend', 'api'])
+
+        assert coordinator._calculate_session_affinity('w1', task) == 4.0
+
+        claimed = await coordinator.request_task(session_id='w1')
+        assert claimed.id == task.id
+        assert claimed.assignee == 'w1'
+        assert claimed.status == TaskStatus.IN_PROGRESS
+
+
+class TestJournalReplay:
+    """Mutations survive a crash through tasks.jsonl."""
+
+    @pytest.mark.asyncio
+    async def test_replay_after_crash(self, coordinator, state_file):
+        """Every mutation type is recovered from the journal alone."""
+        await coordinator.register_session(session_id='w1')
+        parent = await coordinator.create_task(title='Parent')
+        await coordinator.create_subtask(parent_id=parent.id, title='Sub 1')
+        await coordinator.create_subtask(parent_id=parent.id, title='Sub 2')
+        a = await coordinator.create_task(title='A', priority=0)
+        b = await coordinator.create_task(title='B')
+        c = await coordinator.create_task(title='C')
+
+        claimed = await coordinator.request_task(session_id='w1')
+        assert claimed.id == a.id
+        await coordinator.add_note(a.id, 'w1', 'halfway')
+        await coordinator.bulk_complete_tasks([b.id, c.id], 'w1', branch='feature/bc')
+        await coordinator.bulk_reopen_tasks([c.id], 'w1')
+        await coordinator.edit_task(c.id, 'w1', title='C edited')
+        result = await coordinator.delete_task(parent.id, 'w1', force=True)
+        assert len(result['deleted_subtasks']) == 2
+
+        # Killed before any snapshot: only the journal is on disk
+        assert not state_file.exists()
+        assert state_file.with_suffix('.jsonl').exists()
+
+        reloaded = await restart(state_file)
+        assert task_dicts(reloaded) == task_dicts(coordinator.state)
+        assert reloaded.next_id == coordinator.state.next_id
+        assert_indexes_consistent(reloaded)
+
+    @pytest.mark.asyncio
+    async def test_replay_on_top_of_snapshot(self, coordinator, state_file):
+        """Journal lines written after a snapshot are applied to it."""
+        await coordinator.create_task(title='Before')
+        await coordinator.state.save()
+        assert not state_file.with_suffix('.jsonl').exists()
+
+        await coordinator.create_task(title='After')
+
+        reloaded = await restart(state_file)
+        assert [t.title for t in reloaded.tasks.values()] == ['Before', 'After']
+
+    @pytest.mark.asyncio
+    async def test_old_generation_lines_ignored(self, coordinator, state_file):
+        """Lines from before the snapshot's generation are skipped."""
+        await coordinator.create_task(title='Kept')
+        await coordinator.state.save()
+        gen = coordinator.state.journal_gen
+
+        stale = {'id': 'task-099', 'title': 'Stale', 'status': 'open'}
+        state_file.with_suffix('.jsonl').write_text(
+            json.dumps({'gen': gen - 1, 'next_id': 100, 'tasks': [stale]}) + '\n'
+        )
+
+        reloaded = await restart(state_file)
+        assert [t.title for t in reloaded.tasks.values()] == ['Kept']
+        assert reloaded.next_id == 2
+
+    @pytest.mark.asyncio
+    async def test_torn_final_line(self, coordinator, state_file):
+        """A partially written last line ends the replay without failing the load."""
+        await coordinator.create_task(title='Whole')
+        await coordinator.create_task(title='Torn')
+
+        journal = state_file.with_suffix('.jsonl')
+        raw = journal.read_bytes()
+        journal.write_bytes(raw[:-20])
+
+        reloaded = await restart(state_file)
+        assert [t.title for t in reloaded.tasks.values()] == ['Whole']
+
+    @pytest.mark.asyncio
+    async def test_failed_snapshot_keeps_generation(self, coordinator, state_file):
+        """Appends after a failed save stay in a generation replay still applies."""
+        await coordinator.create_task(title='A')
+        with mock.patch.object(CoordinatorState, '_save_sync', side_effect=OSError(28, 'No space left')):
+            with pytest.raises(OSError):
+                await coordinator.state.save()
+        await coordinator.create_task(title='B')
+
+        reloaded = await restart(state_file)
+        assert [t.title for t in reloaded.tasks.values()] == ['A', 'B']
+
+
+class TestIndexes:
+    """ready_ids/done_ids stay in step with is_ready() and task status."""
+
+    @pytest.mark.asyncio
+    async def test_indexes_follow_mutations(self, coordinator, state_file):
+        state = coordinator.state
+        await coordinator.register_session(session_id='w1')
+        a = await coordinator.create_task(title='A', priority=0)
+        b = await coordinator.create_task(title='B', blocked_by=[a.id])
+        c = await coordinator.create_task(title='C')
+        assert_indexes_consistent(state)
+        assert b.id not in state.ready_ids
+
+        await coordinator.request_task(session_id='w1')
+        assert a.id not in state.ready_ids
+        assert_indexes_consistent(state)
+
+        await coordinator.complete_task(a.id, 'w1', branch='feature/a')
+        assert b.id in state.ready_ids
+        assert list(state.done_ids) == [a.id]
+        assert_indexes_consistent(state)
+
+        await coordinator.reopen_task(a.id, 'w1')
+        assert b.id not in state.ready_ids
+        assert_indexes_consistent(state)
+
+        await coordinator.bulk_complete_tasks([a.id, c.id], 'w1')
+        assert_indexes_consistent(state)
+
+        await coordinator.bulk_reopen_tasks([c.id], 'w1')
+        await coordinator.create_subtask(parent_id=c.id, title='C.1')
+        assert_indexes_consistent(state)
+
+        await coordinator.delete_task(a.id, 'w1')
+        assert b.id in state.ready_ids  # Its only blocker is gone
+        assert_indexes_consistent(state)
+
+        await coordinator.end_session('w1')
+        assert_indexes_consistent(state)
+        assert_indexes_consistent(await restart(state_file))
+
+    @pytest.mark.asyncio
+    async def test_status_uses_done_index(self, coordinator):
+        await coordinator.register_session(session_id='w1')
+        a = await coordinator.create_task(title='A')
+        await coordinator.create_task(title='B')
+        await coordinator.request_task(session_id='w1')
+        await coordinator.complete_task(a.id, 'w1', branch='feature/a')
+
+        status = await coordinator.get_status()
+        assert status['ready_tasks'] == 1
+        assert status['completed_with_branches'] == [
+            {'id': a.id, 'title': 'A', 'branch': 'feature/a'}
+        ]
+
+        summary = await coordinator.get_parallel_summary()
+        assert summary['total_completed'] == 1
+        assert summary['branches_to_merge'] == ['feature/a']
+
+
+class TestTaskDict:
+    """Task.to_dict with the snapshot dict cache."""
+
+    @pytest.mark.asyncio
+    async def test_to_dict_reflects_mutations(self, coordinator):
+        """A cached dict never outlives a mutation or leaks to callers."""
+        task = await coordinator.create_task(title='Old', labels=['a'])
+        before = task.to_dict()
+        await coordinator.state.save()  # Fills the snapshot cache
+
+        await coordinator.edit_task(task.id, 'w1', title='New', labels=['b'])
+        await coordinator.add_note(task.id, 'w1', 'progress')
+        after = task.to_dict()
+        assert after['title'] == 'New'
+        assert after['labels'] == ['b']
+        assert after['notes'][-1]['note'] == 'progress'
+        assert before['title'] == 'Old'
+
+        after['title'] = 'Edited by caller'
+        assert task.to_dict()['title'] == 'New'